@@ -0,0 +1,97 @@
+"""Store tests.
+
+Tests SQLiteStore keyset pagination on a temporary database, no API calls.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from chatkit.types import (
+    InferenceOptions,
+    ThreadMetadata,
+    UserMessageItem,
+    UserMessageTextContent,
+)
+from store import SQLiteStore
+
+T0 = datetime(2025, 1, 1, tzinfo=UTC)
+# Three rows share T0, so only the id breaks ties between them.
+STAMPS = [T0, T0, T0, T0 + timedelta(seconds=1), T0 + timedelta(seconds=2)]
+IDS = ["a", "b", "c", "d", "e"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = SQLiteStore(tmp_path / "threads.db")
+    yield s
+    s.conn.close()
+
+
+def message(item_id, created_at):
+    return UserMessageItem(
+        id=item_id,
+        thread_id="t",
+        created_at=created_at,
+        content=[UserMessageTextContent(text=item_id)],
+        inference_options=InferenceOptions(),
+    )
+
+
+async def collect(load_page, limit):
+    """Follow `after` cursors until has_more is False; return ids per page."""
+    pages, after = [], None
+    while True:
+        page = await load_page(after, limit)
+        pages.append([row.id for row in page.data])
+        if not page.has_more:
+            return pages
+        after = page.after
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_threads_page_through_shared_timestamps(store, order):
+    for thread_id, created_at in zip(IDS, STAMPS, strict=True):
+        await store.save_thread(ThreadMetadata(id=thread_id, created_at=created_at), {})
+
+    pages = await collect(lambda after, limit: store.load_threads(limit, after, order, {}), limit=2)
+
+    expected = IDS if order == "asc" else IDS[::-1]
+    assert pages == [expected[0:2], expected[2:4], expected[4:]]
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_items_page_through_shared_timestamps(store, order):
+    for item_id, created_at in zip(IDS, STAMPS, strict=True):
+        await store.add_thread_item("t", message(item_id, created_at), {})
+
+    pages = await collect(
+        lambda after, limit: store.load_thread_items("t", after, limit, order, {}), limit=2
+    )
+
+    expected = IDS if order == "asc" else IDS[::-1]
+    assert pages == [expected[0:2], expected[2:4], expected[4:]]
+
+
+async def test_zero_limit_returns_empty_page_and_keeps_cursor(store):
+    for item_id, created_at in zip(IDS, STAMPS, strict=True):
+        await store.save_thread(ThreadMetadata(id=item_id, created_at=created_at), {})
+        await store.add_thread_item("t", message(item_id, created_at), {})
+
+    threads = await store.load_threads(0, "b", "asc", {})
+    items = await store.load_thread_items("t", "b", 0, "asc", {})
+
+    for page in (threads, items):
+        assert page.data == []
+        assert page.has_more
+        assert page.after == "b"
+
+
+async def test_deleted_cursor_yields_empty_page(store):
+    for item_id, created_at in zip(IDS, STAMPS, strict=True):
+        await store.add_thread_item("t", message(item_id, created_at), {})
+    await store.delete_thread_item("t", "b", {})
+
+    page = await store.load_thread_items("t", "b", 2, "asc", {})
+
+    assert page.data == []
+    assert not page.has_more
@@ -6,6 +6,7 @@ Intent: File operations, template deployment, and Todo management.
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 import shutil
 from contextvars import ContextVar
@@ -24,7 +25,11 @@ LIBRARY_ROOT = MODULE_ROOT.parent.parent.parent.parent
 DOCS_DIR = LIBRARY_ROOT / "docs" / "en"
 SRC_DIR = LIBRARY_ROOT / "src" / "agentic_flow"
 
+# Build artifacts never deployed from the template (matched at any depth)
+TEMPLATE_IGNORE = shutil.ignore_patterns("__pycache__", "*.pyc", "node_modules", ".next", "dist")
 
+
+@functools.cache
 def load_knowledge() -> str:
     """Load essential knowledge files only.
 
@@ -38,6 +43,7 @@ def load_knowledge() -> str:
     return ""
 
 
+@functools.cache
 def load_docs() -> str:
     """Load core design philosophy from concepts/index.md.
 
@@ -54,6 +60,7 @@ def load_docs() -> str:
     return ""
 
 
+@functools.cache
 def load_source() -> str:
     """Load public API exports only.
 
@@ -415,11 +422,16 @@ async def verify_todo(content: str, verified: bool = True) -> str:
     return f"Error: No todo matching '{content}'"
 
 
+def copy_template_file(src: str, dst: str) -> str:
+    """copytree copy_function that writes *.tmpl files under their final name."""
+    return shutil.copy2(src, dst.removesuffix(".tmpl"))
+
+
 def deploy_template(output_dir: str) -> str:
     """Deploy template to output directory.
 
-    Copies template files (excluding frontend/node_modules) to output_dir.
-    Renames .tmpl files by removing the .tmpl suffix.
+    Copies template files (excluding TEMPLATE_IGNORE artifacts) to output_dir.
+    Strips the .tmpl suffix while copying (no separate rename pass).
     Runs uv sync to create .venv for coder's exec_command.
     Frontend requires clean npm install after deployment.
 
@@ -436,29 +448,11 @@ def deploy_template(output_dir: str) -> str:
     if output_path.exists():
         return f"Error: Output directory already exists: {output_dir}"
 
-    output_path.mkdir(parents=True)
-
-    for item in TEMPLATE_ROOT.iterdir():
-        if item.name == "__pycache__":
-            continue
-
-        dst = output_path / item.name
-
-        if item.is_dir():
-            if item.name == "frontend":
-                shutil.copytree(
-                    item,
-                    dst,
-                    ignore=shutil.ignore_patterns("node_modules", ".next", "dist"),
-                )
-            else:
-                shutil.copytree(item, dst)
-        else:
-            shutil.copy2(item, dst)
-
-    for tmpl_file in output_path.rglob("*.tmpl"):
-        target = tmpl_file.with_suffix("")
-        tmpl_file.rename(target)
+    # Files are copied, not hardlinked: coder edits the deployed files in place,
+    # which would otherwise write through to the shipped template.
+    shutil.copytree(
+        TEMPLATE_ROOT, output_path, ignore=TEMPLATE_IGNORE, copy_function=copy_template_file
+    )
 
     subprocess.run(
         ["uv", "sync", "--all-extras"],
@@ -37,6 +37,8 @@ Todo Responsibility:
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
@@ -53,6 +55,8 @@ from .types import RunResult
 if TYPE_CHECKING:
     from agentic_flow.types import Handler
 
+logger = logging.getLogger(__name__)
+
 
 class State(Enum):
     """State machine states.
@@ -69,6 +73,20 @@ class State(Enum):
 
 
 MAX_LOOP = 10
+MAX_TURNS = 100
+MIN_TURNS = 20
+CODER_TIMEOUT = 180  # seconds per coder phase
+REFLECTOR_TIMEOUT = 120  # seconds per reflect phase
+
+
+def turn_budget(iteration: int) -> int:
+    """Per-call max_turns for a loop iteration.
+
+    Shrinks linearly with remaining iterations so the first pass keeps the
+    full MAX_TURNS budget while a looping run cannot burn MAX_TURNS on every pass.
+    """
+    remaining = MAX_LOOP - iteration
+    return max(MIN_TURNS, MAX_TURNS * remaining // MAX_LOOP)
 
 
 class Transcoder:
@@ -118,6 +136,11 @@ class Transcoder:
             REFLECTOR --> CODER: has_pending
             REFLECTOR --> [*]: all_verified
 
+        Timeouts:
+            CODER exceeding CODER_TIMEOUT logs a warning and proceeds to TEST.
+            REFLECTOR exceeding REFLECTOR_TIMEOUT logs a warning and ends with
+            the last test result.
+
         Returns:
             RunResult with test execution results
         """
@@ -128,27 +151,42 @@ class Transcoder:
         deploy_template(self.output_dir)
         current_todos.set(self.todos)
 
-        for _ in range(MAX_LOOP):
+        for i in range(MAX_LOOP):
+            turns = turn_budget(i)
             match state:
                 case State.CODER:
-                    if last_test_failed:
-                        async with phase("🔧 Fix"):
-                            prompt = FIX_PROMPT.format(
-                                output_dir=self.output_dir,
-                                errors=format_errors(test.errors) if test else "",
-                            )
-                            await coder(prompt).max_turns(100).stream()
-                    elif self.has_pending_todos():
-                        async with phase("💫 Improve"):
-                            prompt = IMPROVE_PROMPT.format(output_dir=self.output_dir)
-                            await coder(prompt).max_turns(100).stream()
-                    else:
-                        async with phase("🚀 Generate"):
-                            prompt = GENERATE_PROMPT.format(
-                                output_dir=self.output_dir,
-                                source_code=self.source_code,
-                            )
-                            await coder(prompt).max_turns(100).stream()
+                    # A hung coder call is logged and abandoned; Test checks whatever was written.
+                    try:
+                        if last_test_failed:
+                            async with phase("🔧 Fix"):
+                                prompt = FIX_PROMPT.format(
+                                    output_dir=self.output_dir,
+                                    errors=format_errors(test.errors) if test else "",
+                                )
+                                await asyncio.wait_for(
+                                    coder(prompt).max_turns(turns).stream(), CODER_TIMEOUT
+                                )
+                        elif self.has_pending_todos():
+                            async with phase("💫 Improve"):
+                                prompt = IMPROVE_PROMPT.format(output_dir=self.output_dir)
+                                await asyncio.wait_for(
+                                    coder(prompt).max_turns(turns).stream(), CODER_TIMEOUT
+                                )
+                        else:
+                            async with phase("🚀 Generate"):
+                                prompt = GENERATE_PROMPT.format(
+                                    output_dir=self.output_dir,
+                                    source_code=self.source_code,
+                                )
+                                await asyncio.wait_for(
+                                    coder(prompt).max_turns(turns).stream(), CODER_TIMEOUT
+                                )
+                    except TimeoutError:
+                        logger.warning(
+                            "Coder timed out after %ss on iteration %d; testing current output",
+                            CODER_TIMEOUT,
+                            i + 1,
+                        )
                     state = State.TEST
 
                 case State.TEST:
@@ -164,12 +202,23 @@ class Transcoder:
                         state = State.REFLECTOR
 
                 case State.REFLECTOR:
-                    async with phase("💎 Reflect"):
-                        prompt = REFLECT_PROMPT.format(
-                            output_dir=self.output_dir,
-                            source_code=self.source_code,
+                    # Tests already passed; a hung review ends the run with that result.
+                    try:
+                        async with phase("💎 Reflect"):
+                            prompt = REFLECT_PROMPT.format(
+                                output_dir=self.output_dir,
+                                source_code=self.source_code,
+                            )
+                            reflection = await asyncio.wait_for(
+                                reflector(prompt).max_turns(turns).stream(), REFLECTOR_TIMEOUT
+                            )
+                    except TimeoutError:
+                        logger.warning(
+                            "Reflector timed out after %ss on iteration %d; ending with last test",
+                            REFLECTOR_TIMEOUT,
+                            i + 1,
                         )
-                        reflection = await reflector(prompt).max_turns(100).stream()
+                        break
 
                     if reflection.patterns_ok and self.all_verified():
                         break
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import re
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -18,6 +19,10 @@ from .types import RunResult, TestError, TestEvent
 if TYPE_CHECKING:
     Handler = Callable[[Any], Any]
 
+# Only the tail of pytest output is kept for parsing (summary + FAILED lines).
+# Bounds memory when a generated project floods stdout.
+MAX_OUTPUT_LINES = 5000
+
 
 def parse_pytest_output(output: str) -> list[TestError]:
     """Parse pytest output to extract structured errors."""
@@ -109,7 +114,7 @@ class TestRunner:
             stderr=asyncio.subprocess.STDOUT,
         )
 
-        output_lines: list[str] = []
+        output_lines: deque[str] = deque(maxlen=MAX_OUTPUT_LINES)
 
         async for line in proc.stdout:
             text = line.decode().rstrip()
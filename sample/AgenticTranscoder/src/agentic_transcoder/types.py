@@ -17,6 +17,8 @@ ContentType = Literal["text", "markdown", "json"]
 class TestError(BaseModel):
     """Individual test error."""
 
+    __test__ = False  # not a pytest test class despite the name
+
     file: str
     line: int | None = None
     message: str
@@ -0,0 +1,94 @@
+"""pytest configuration for AgenticTranscoder tests."""
+
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+from rich.console import Console
+
+from agentic_transcoder.agents.tools import current_todos
+from agentic_transcoder.console.display import TranscoderDisplay
+from agentic_transcoder.console.handler import EventHandler, create_handler
+from agentic_transcoder.types import RunResult, TestError
+
+ENV_FILE = Path(__file__).parent.parent / ".env.local"
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip @pytest.mark.integration tests when no API key is available.
+
+    The environment is read once, after collection, so importing test modules
+    never touches .env.local and keys injected late are still honoured.
+    """
+    if "OPENAI_API_KEY" not in os.environ and ENV_FILE.is_file():
+        load_dotenv(ENV_FILE)
+    if os.environ.get("OPENAI_API_KEY"):
+        return
+
+    skip = pytest.mark.skip(reason="OPENAI_API_KEY not set")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_result_models() -> None:
+    """Validate one RunResult/TestError up front.
+
+    The first validation of each model pays one-off setup, so it happens once
+    per session instead of inside whichever test runs first.
+    """
+    RunResult(passed=True, errors=[TestError(file="warmup.py", message="warmup")])
+
+
+@pytest.fixture(scope="session")
+def console() -> Console:
+    """One plain Console for the whole run.
+
+    Tests assert on display state, never on rendered output, so skip terminal
+    probing and colour detection and write into a throwaway buffer. The width
+    fits PANEL_WIDTH panels without wrapping.
+    """
+    return Console(
+        file=io.StringIO(),
+        force_terminal=False,
+        color_system=None,
+        legacy_windows=False,
+        no_color=True,
+        highlight=False,
+        width=120,
+    )
+
+
+@pytest.fixture
+def handler_pair(console: Console) -> Iterator[tuple[TranscoderDisplay, EventHandler]]:
+    """Fresh create_handler() result on the shared console, with its Live stopped afterwards."""
+    d, handler = create_handler(console)
+    yield d, handler
+    d.stop_live()
+
+
+@pytest.fixture
+def display(handler_pair: tuple[TranscoderDisplay, EventHandler]) -> TranscoderDisplay:
+    """The display from handler_pair, for display-only tests."""
+    return handler_pair[0]
+
+
+@pytest.fixture
+def todos_ctx() -> Iterator[Callable[[list[dict[str, str]]], None]]:
+    """Setter for current_todos that is rolled back after the test.
+
+    Keeps todo lists from leaking between tests through the ContextVar.
+    """
+    token = current_todos.set([])
+
+    def set_todos(todos: list[dict[str, str]]) -> None:
+        current_todos.set(todos)
+
+    yield set_todos
+    current_todos.reset(token)
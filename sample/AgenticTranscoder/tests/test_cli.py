@@ -17,11 +17,6 @@ import sys
 from pathlib import Path
 
 import pytest
-from dotenv import load_dotenv
-
-load_dotenv(Path(__file__).parent.parent / ".env.local")
-
-HAS_API_KEY = bool(os.getenv("OPENAI_API_KEY"))
 
 MINIMAL_FIXTURE = """\
 from agents import Agent
@@ -168,7 +163,7 @@ class TestCLIBasic:
         assert "No generated projects" in result.stdout or "No generated" in result.stderr
 
 
-@pytest.mark.skipif(not HAS_API_KEY, reason="OPENAI_API_KEY not set")
+@pytest.mark.integration
 @pytest.mark.timeout(300)
 class TestCLISmoke:
     """Smoke test: CLI runs and produces output (requires API)."""
@@ -2,7 +2,8 @@
 
 Intent: Test deploy_template and coder agent with real operations.
 deploy_template tests run without API (fast).
-coder agent tests require OPENAI_API_KEY (slow, 60-120s).
+coder agent tests require OPENAI_API_KEY (single-turn smoke test).
+The streaming coder test is slow and also needs PYTEST_RUN_SLOW=1.
 
 Philosophy v3 compliant - 1 agent (coder), no legacy agents.
 """
@@ -13,68 +14,69 @@ import os
 from pathlib import Path
 
 import pytest
-from dotenv import load_dotenv
 
-load_dotenv(Path(__file__).parent.parent / ".env.local")
+from agentic_transcoder.agents import (
+    CODER_INSTRUCTIONS,
+    coder,
+    deploy_template,
+    load_docs,
+    load_knowledge,
+    load_source,
+)
+from agentic_transcoder.agents.tools import copy_template_file
 
-HAS_API_KEY = bool(os.getenv("OPENAI_API_KEY"))
+RUN_SLOW = os.getenv("PYTEST_RUN_SLOW") == "1"
+
+
+@pytest.fixture(scope="session")
+def deployed_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Deploy the template once per session (deploy_template is I/O heavy)."""
+    base = tmp_path_factory.mktemp("template") / "project"
+    deploy_template(str(base))
+    return base
+
+
+@pytest.fixture(scope="session")
+def deployed_tree(deployed_template: Path) -> frozenset[str]:
+    """Relative paths of the deployed template (dirs end with "/"), walked once.
+
+    .venv is pruned: it is created by uv sync, not copied from the template.
+    """
+    paths: set[str] = set()
+    for root, dirs, files in os.walk(deployed_template):
+        dirs[:] = [d for d in dirs if d != ".venv"]
+        rel = Path(root).relative_to(deployed_template).as_posix()
+        prefix = "" if rel == "." else f"{rel}/"
+        paths.update(f"{prefix}{name}" for name in files)
+        paths.update(f"{prefix}{name}/" for name in dirs)
+    return frozenset(paths)
 
 
 class TestDeployTemplate:
     """Test deploy_template function (no API required)."""
 
     def test_deploy_creates_directory(self, tmp_path: Path):
-        from agentic_transcoder.agents import deploy_template
-
         output_dir = tmp_path / "project"
         result = deploy_template(str(output_dir))
 
         assert output_dir.exists()
         assert "Deployed" in result
 
-    def test_deploy_copies_required_files(self, tmp_path: Path):
-        from agentic_transcoder.agents import deploy_template
-
-        output_dir = tmp_path / "project"
-        deploy_template(str(output_dir))
-
-        assert (output_dir / "agent_specs.py").exists()
-        assert (output_dir / "flow.py").exists()
-        assert (output_dir / "server.py").exists()
-        assert (output_dir / "store.py").exists()
-        assert (output_dir / "pyproject.toml").exists()
-
-    def test_deploy_copies_frontend(self, tmp_path: Path):
-        from agentic_transcoder.agents import deploy_template
+    def test_deploy_copies_required_files(self, deployed_tree: frozenset[str]):
+        required = {"agent_specs.py", "flow.py", "server.py", "store.py", "pyproject.toml"}
+        assert required <= deployed_tree
 
-        output_dir = tmp_path / "project"
-        deploy_template(str(output_dir))
-
-        assert (output_dir / "frontend").exists()
-        assert (output_dir / "frontend" / "package.json").exists()
-
-    def test_deploy_excludes_node_modules(self, tmp_path: Path):
-        from agentic_transcoder.agents import deploy_template
-
-        output_dir = tmp_path / "project"
-        deploy_template(str(output_dir))
+    def test_deploy_copies_frontend(self, deployed_tree: frozenset[str]):
+        assert "frontend/package.json" in deployed_tree
 
+    def test_deploy_excludes_node_modules(self, deployed_tree: frozenset[str]):
         # node_modules should never be copied
-        assert not (output_dir / "frontend" / "node_modules").exists()
+        assert "frontend/node_modules/" not in deployed_tree
 
-    def test_deploy_copies_tests(self, tmp_path: Path):
-        from agentic_transcoder.agents import deploy_template
-
-        output_dir = tmp_path / "project"
-        deploy_template(str(output_dir))
-
-        assert (output_dir / "tests").exists()
-        assert (output_dir / "tests" / "test_flow.py").exists()
-        assert (output_dir / "tests" / "test_server.py").exists()
+    def test_deploy_copies_tests(self, deployed_tree: frozenset[str]):
+        assert {"tests/test_flow.py", "tests/test_server.py"} <= deployed_tree
 
     def test_deploy_fails_if_exists(self, tmp_path: Path):
-        from agentic_transcoder.agents import deploy_template
-
         output_dir = tmp_path / "project"
         output_dir.mkdir()
 
@@ -83,96 +85,105 @@ class TestDeployTemplate:
         assert "Error" in result
         assert "already exists" in result
 
-    def test_deploy_excludes_pycache(self, tmp_path: Path):
-        from agentic_transcoder.agents import deploy_template
-
-        output_dir = tmp_path / "project"
-        deploy_template(str(output_dir))
-
-        # __pycache__ should never be copied
-        pycache_dirs = list(output_dir.rglob("__pycache__"))
-        assert len(pycache_dirs) == 0
-
-    def test_deploy_renames_tmpl_files(self, tmp_path: Path):
-        from agentic_transcoder.agents import deploy_template
-
-        output_dir = tmp_path / "project"
-        deploy_template(str(output_dir))
+    def test_deploy_excludes_pycache(self, deployed_tree: frozenset[str]):
+        # __pycache__ should never be copied (only Python source dirs can hold one)
+        assert not {"__pycache__/", "tests/__pycache__/"} & deployed_tree
 
+    def test_deploy_renames_tmpl_files(self, deployed_tree: frozenset[str]):
         # .tmpl files should be renamed (suffix removed)
-        tmpl_files = list(output_dir.rglob("*.tmpl"))
-        assert len(tmpl_files) == 0
+        assert not any(p.endswith(".tmpl") for p in deployed_tree)
 
         # App.tsx should exist (renamed from App.tsx.tmpl)
-        assert (output_dir / "frontend" / "src" / "App.tsx").exists()
+        assert "frontend/src/App.tsx" in deployed_tree
 
+    def test_copy_template_file_strips_tmpl_suffix(self, tmp_path: Path):
+        src = tmp_path / "App.tsx.tmpl"
+        src.write_text("export {}")
 
-class TestKnowledgeLoading:
-    """Test dynamic knowledge loading (no API required)."""
+        copy_template_file(str(src), str(tmp_path / "out.tsx.tmpl"))
 
-    def test_load_knowledge_returns_string(self):
-        from agentic_transcoder.agents import load_knowledge
+        assert (tmp_path / "out.tsx").read_text() == "export {}"
+        assert not (tmp_path / "out.tsx.tmpl").exists()
 
-        content = load_knowledge()
 
-        assert isinstance(content, str)
-        assert len(content) > 0
+@pytest.fixture(scope="session")
+def knowledge() -> str:
+    return load_knowledge()
 
-    def test_load_knowledge_contains_guidelines(self):
-        from agentic_transcoder.agents import load_knowledge
 
-        content = load_knowledge()
+@pytest.fixture(scope="session")
+def docs() -> str:
+    return load_docs()
+
+
+@pytest.fixture(scope="session")
+def source() -> str:
+    return load_source()
 
-        # Should contain agentic-flow-guidelines content
-        assert "agentic-flow-guidelines" in content or "Agentic Flow" in content
 
-    def test_load_docs_returns_string(self):
-        from agentic_transcoder.agents import load_docs
+class TestKnowledgeLoading:
+    """Test dynamic knowledge loading (no API required)."""
 
-        content = load_docs()
+    def test_load_knowledge_returns_string(self, knowledge: str):
+        assert isinstance(knowledge, str)
+        assert len(knowledge) > 0
 
-        assert isinstance(content, str)
+    def test_load_knowledge_contains_guidelines(self, knowledge: str):
+        # Should contain agentic-flow-guidelines content
+        assert "agentic-flow-guidelines" in knowledge or "Agentic Flow" in knowledge
 
-    def test_load_source_returns_string(self):
-        from agentic_transcoder.agents import load_source
+    def test_load_docs_returns_string(self, docs: str):
+        assert isinstance(docs, str)
 
-        content = load_source()
+    def test_load_source_returns_string(self, source: str):
+        assert isinstance(source, str)
 
-        assert isinstance(content, str)
+    def test_loaders_are_cached(self):
+        assert load_knowledge() is load_knowledge()
+        assert load_docs() is load_docs()
+        assert load_source() is load_source()
 
 
 class TestCoderAgentStructure:
     """Test coder agent structure (no API required)."""
 
     def test_coder_has_file_tools(self):
-        from agentic_transcoder.agents import coder
+        tool_names = {t.name for t in coder.sdk_kwargs.get("tools", [])}
+        required = {"read_file", "write_file", "edit_file", "list_files", "exec_command"}
 
-        tools = coder.sdk_kwargs.get("tools", [])
-        tool_names = [t.name for t in tools]
-
-        assert "read_file" in tool_names
-        assert "write_file" in tool_names
-        assert "edit_file" in tool_names
-        assert "list_files" in tool_names
-        assert "exec_command" in tool_names
+        assert required <= tool_names, f"missing tools: {required - tool_names}"
 
     def test_coder_instructions_contain_knowledge(self):
-        from agentic_transcoder.agents import CODER_INSTRUCTIONS
-
         assert "Agentic Flow" in CODER_INSTRUCTIONS
         assert "agent_specs.py" in CODER_INSTRUCTIONS
         assert "gpt-5.2" in CODER_INSTRUCTIONS
 
 
-@pytest.mark.skipif(not HAS_API_KEY, reason="OPENAI_API_KEY not set")
-@pytest.mark.timeout(120)
+@pytest.mark.integration
+@pytest.mark.xdist_group("api")
+@pytest.mark.asyncio(loop_scope="session")
 class TestCoderAgentAPI:
-    """Test coder agent with real API (60-120s per test)."""
+    """Test coder agent with real API.
 
-    @pytest.mark.asyncio
+    Each test sets its own timeout: the shortest bound it reliably passes in,
+    so a hung API call fails fast.
+
+    All tests share one session event loop, so the SDK's lazily created
+    HTTP client and its connection pool are reused instead of rebuilt per test.
+    """
+
+    @pytest.mark.timeout(30)
     async def test_coder_returns_string(self):
-        from agentic_transcoder.agents import coder
+        # Non-streaming with a small turn budget: coder has tools, so allow a tool call or two
+        result = await coder("Say hello").max_turns(3)
+
+        assert isinstance(result, str)
+        assert len(result) > 0
 
+    @pytest.mark.slow
+    @pytest.mark.skipif(not RUN_SLOW, reason="set PYTEST_RUN_SLOW=1 to run")
+    @pytest.mark.timeout(120)
+    async def test_coder_streams_string(self):
         result = await coder("Say hello").max_turns(3).stream()
 
         assert isinstance(result, str)
@@ -14,33 +14,53 @@ from __future__ import annotations
 import asyncio
 import inspect
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
+from rich.console import Console
 
-class TestAgents:
-    """Test agents.py module - single coder agent."""
 
-    def test_coder_agent_exists(self):
-        from agentic_transcoder.agents import coder
+@pytest.fixture(scope="module")
+def at() -> SimpleNamespace:
+    """Everything these tests inspect, imported once for the whole module."""
+    from agentic_flow import Runner
+
+    import agentic_transcoder
+    from agentic_transcoder import agents, flow, tools, types
+    from agentic_transcoder.agents.coder import GENERATE_PROMPT
+    from agentic_transcoder.console import create_handler, display, handler
 
-        assert coder.sdk_kwargs.get("name") == "coder"
+    return SimpleNamespace(
+        package=agentic_transcoder,
+        agents=agents,
+        flow=flow,
+        tools=tools,
+        types=types,
+        display=display,
+        handler=handler,
+        create_handler=create_handler,
+        GENERATE_PROMPT=GENERATE_PROMPT,
+        Runner=Runner,
+    )
 
-    def test_coder_has_correct_model(self):
-        from agentic_transcoder.agents import coder
 
-        assert coder.sdk_kwargs.get("model") == "gpt-5.2"
+class TestAgents:
+    """Test agents.py module - single coder agent."""
+
+    def test_coder_agent_exists(self, at):
+        assert at.agents.coder.sdk_kwargs.get("name") == "coder"
 
-    def test_coder_has_reasoning_high(self):
-        from agentic_transcoder.agents import coder
+    def test_coder_has_correct_model(self, at):
+        assert at.agents.coder.sdk_kwargs.get("model") == "gpt-5.2"
 
-        model_settings = coder.sdk_kwargs.get("model_settings")
+    def test_coder_has_reasoning_high(self, at):
+        model_settings = at.agents.coder.sdk_kwargs.get("model_settings")
         assert model_settings is not None
         assert model_settings.reasoning is not None
         assert model_settings.reasoning.effort == "high"
 
-    def test_coder_has_file_tools(self):
-        from agentic_transcoder.agents import coder
-
-        tools = coder.sdk_kwargs.get("tools", [])
+    def test_coder_has_file_tools(self, at):
+        tools = at.agents.coder.sdk_kwargs.get("tools", [])
         tool_names = [t.name for t in tools]
         assert "read_file" in tool_names
         assert "write_file" in tool_names
@@ -48,15 +68,11 @@ class TestAgents:
         assert "list_files" in tool_names
         assert "exec_command" in tool_names
 
-    def test_deploy_template_function_exists(self):
-        from agentic_transcoder.agents import deploy_template
-
-        assert callable(deploy_template)
+    def test_deploy_template_function_exists(self, at):
+        assert callable(at.agents.deploy_template)
 
-    def test_deploy_template_signature(self):
-        from agentic_transcoder.agents import deploy_template
-
-        sig = inspect.signature(deploy_template)
+    def test_deploy_template_signature(self, at):
+        sig = inspect.signature(at.agents.deploy_template)
         params = list(sig.parameters.keys())
         assert "output_dir" in params
 
@@ -64,46 +80,36 @@ class TestAgents:
 class TestTypes:
     """Test types.py - RunResult and TestError only."""
 
-    def test_run_result_model(self):
-        from agentic_transcoder.types import RunResult
-
-        result = RunResult(passed=True, total=5, failed_count=0)
+    def test_run_result_model(self, at):
+        result = at.types.RunResult(passed=True, total=5, failed_count=0)
         assert result.passed is True
         assert result.failed is False
         assert result.errors == []
 
-    def test_run_result_failed_property(self):
-        from agentic_transcoder.types import RunResult
-
-        result = RunResult(passed=False, total=3, failed_count=2)
+    def test_run_result_failed_property(self, at):
+        result = at.types.RunResult(passed=False, total=3, failed_count=2)
         assert result.failed is True
         assert result.passed is False
 
-    def test_test_error_model(self):
-        from agentic_transcoder.types import TestError
-
-        error = TestError(file="test.py", line=10, message="Failed")
+    def test_test_error_model(self, at):
+        error = at.types.TestError(file="test.py", line=10, message="Failed")
         assert error.file == "test.py"
         assert error.line == 10
         assert error.message == "Failed"
 
-    def test_test_error_optional_fields(self):
-        from agentic_transcoder.types import TestError
-
-        error = TestError(file="test.py", message="Failed")
+    def test_test_error_optional_fields(self, at):
+        error = at.types.TestError(file="test.py", message="Failed")
         assert error.line is None
         assert error.traceback is None
 
-    def test_run_result_with_errors(self):
-        from agentic_transcoder.types import RunResult, TestError
-
-        result = RunResult(
+    def test_run_result_with_errors(self, at):
+        result = at.types.RunResult(
             passed=False,
             total=3,
             failed_count=2,
             errors=[
-                TestError(file="test_flow.py", message="AssertionError"),
-                TestError(file="test_server.py", line=42, message="ConnectionError"),
+                at.types.TestError(file="test_flow.py", message="AssertionError"),
+                at.types.TestError(file="test_server.py", line=42, message="ConnectionError"),
             ],
         )
         assert len(result.errors) == 2
@@ -112,90 +118,69 @@ class TestTypes:
 class TestFlow:
     """Test flow.py - Transcoder class and 2 phases."""
 
-    def test_transcoder_class_exists(self):
-        from agentic_transcoder.flow import Transcoder
-
-        assert Transcoder is not None
+    def test_transcoder_class_exists(self, at):
+        assert at.flow.Transcoder is not None
 
-    def test_transcoder_init_params(self):
-        from agentic_transcoder.flow import Transcoder
-
-        sig = inspect.signature(Transcoder.__init__)
+    def test_transcoder_init_params(self, at):
+        sig = inspect.signature(at.flow.Transcoder.__init__)
         params = list(sig.parameters.keys())
         assert "source_code" in params
         assert "output_dir" in params
         # with_frontend is REMOVED (frontend mandatory)
         assert "with_frontend" not in params
 
-    def test_transcoder_flow_method(self):
-        from agentic_transcoder.flow import Transcoder
-
-        r = Transcoder("source", "/tmp/out")
+    def test_transcoder_flow_method(self, at):
+        r = at.flow.Transcoder("source", "/tmp/out")
         assert hasattr(r, "flow")
         assert asyncio.iscoroutinefunction(r.flow)
 
-    def test_transcoder_runner_method(self):
-        from agentic_flow import Runner
-
-        from agentic_transcoder.flow import Transcoder
-
-        r = Transcoder("source", "/tmp/out")
+    def test_transcoder_runner_method(self, at):
+        r = at.flow.Transcoder("source", "/tmp/out")
         assert hasattr(r, "runner")
         runner = r.runner()
-        assert isinstance(runner, Runner)
-
-    def test_transcoder_returns_run_result(self):
-        from agentic_transcoder.flow import Transcoder
-        from agentic_transcoder.types import RunResult
+        assert isinstance(runner, at.Runner)
 
-        hints = inspect.get_annotations(Transcoder.flow)
-        assert hints.get("return") in ("RunResult", RunResult)
+    def test_transcoder_returns_run_result(self, at):
+        hints = inspect.get_annotations(at.flow.Transcoder.flow)
+        assert hints.get("return") in ("RunResult", at.types.RunResult)
 
-    def test_transcode_function_exists(self):
-        from agentic_transcoder.flow import transcode
+    def test_transcode_function_exists(self, at):
+        assert callable(at.flow.transcode)
 
-        assert callable(transcode)
+    def test_transcode_is_async(self, at):
+        assert asyncio.iscoroutinefunction(at.flow.transcode)
 
-    def test_transcode_is_async(self):
-        from agentic_transcoder.flow import transcode
-
-        assert asyncio.iscoroutinefunction(transcode)
-
-    def test_transcode_signature(self):
-        from agentic_transcoder.flow import transcode
-
-        sig = inspect.signature(transcode)
+    def test_transcode_signature(self, at):
+        sig = inspect.signature(at.flow.transcode)
         params = list(sig.parameters.keys())
         assert "source_code" in params
         assert "output_dir" in params
         # with_frontend is REMOVED (frontend mandatory)
         assert "with_frontend" not in params
 
-    def test_runner_exists(self):
-        from agentic_transcoder.flow import runner
+    def test_runner_exists(self, at):
+        assert at.flow.runner is not None
 
-        assert runner is not None
+    def test_turn_budget_shrinks_per_iteration(self, at):
+        budgets = [at.flow.turn_budget(i) for i in range(at.flow.MAX_LOOP)]
+        assert budgets[0] == at.flow.MAX_TURNS
+        assert budgets == sorted(budgets, reverse=True)
+        assert min(budgets) >= at.flow.MIN_TURNS
 
 
 class TestPrompts:
     """Test prompt templates in agents/coder/instructions.py."""
 
-    def test_generate_prompt_exists(self):
-        from agentic_transcoder.agents.coder import GENERATE_PROMPT
-
-        assert GENERATE_PROMPT is not None
-        assert len(GENERATE_PROMPT) > 0
-
-    def test_generate_prompt_has_placeholders(self):
-        from agentic_transcoder.agents.coder import GENERATE_PROMPT
+    def test_generate_prompt_exists(self, at):
+        assert at.GENERATE_PROMPT is not None
+        assert len(at.GENERATE_PROMPT) > 0
 
-        assert "{output_dir}" in GENERATE_PROMPT
-        assert "{source_code}" in GENERATE_PROMPT
+    def test_generate_prompt_has_placeholders(self, at):
+        assert "{output_dir}" in at.GENERATE_PROMPT
+        assert "{source_code}" in at.GENERATE_PROMPT
 
-    def test_generate_prompt_is_formattable(self):
-        from agentic_transcoder.agents.coder import GENERATE_PROMPT
-
-        result = GENERATE_PROMPT.format(
+    def test_generate_prompt_is_formattable(self, at):
+        result = at.GENERATE_PROMPT.format(
             output_dir="/tmp/test",
             source_code="from agents import Agent",
         )
@@ -206,73 +191,54 @@ class TestPrompts:
 class TestTools:
     """Test tools.py module - Pure functions."""
 
-    def test_run_tests_exists(self):
-        from agentic_transcoder.tools import run_tests
-
-        assert callable(run_tests)
-        assert asyncio.iscoroutinefunction(run_tests)
-
-    def test_format_errors_function(self):
-        from agentic_transcoder.tools import format_errors
-        from agentic_transcoder.types import TestError
+    def test_run_tests_exists(self, at):
+        assert callable(at.tools.run_tests)
+        assert asyncio.iscoroutinefunction(at.tools.run_tests)
 
+    def test_format_errors_function(self, at):
         errors = [
-            TestError(file="test.py", line=10, message="Failed"),
-            TestError(file="server.py", message="Timeout"),
+            at.types.TestError.model_construct(file="test.py", line=10, message="Failed"),
+            at.types.TestError.model_construct(file="server.py", message="Timeout"),
         ]
-        result = format_errors(errors)
+        result = at.tools.format_errors(errors)
         assert "test.py:10" in result
         assert "server.py:" in result
 
-    def test_format_errors_empty(self):
-        from agentic_transcoder.tools import format_errors
-
-        result = format_errors([])
+    def test_format_errors_empty(self, at):
+        result = at.tools.format_errors([])
         assert result == "(none)"
 
 
 class TestPublicAPI:
     """Test __init__.py public API - v3 exports."""
 
-    def test_coder_exported(self):
-        from agentic_transcoder import coder
-
-        assert coder is not None
+    def test_coder_exported(self, at):
+        assert at.package.coder is not None
 
-    def test_deploy_template_exported(self):
-        from agentic_transcoder import deploy_template
+    def test_deploy_template_exported(self, at):
+        assert at.package.deploy_template is not None
+        assert callable(at.package.deploy_template)
 
-        assert deploy_template is not None
-        assert callable(deploy_template)
+    def test_flow_exported(self, at):
+        assert at.package.Transcoder is not None
+        assert callable(at.package.transcode)
+        assert at.package.runner is not None
 
-    def test_flow_exported(self):
-        from agentic_transcoder import Transcoder, runner, transcode
-
-        assert Transcoder is not None
-        assert callable(transcode)
-        assert runner is not None
-
-    def test_types_exported(self):
-        from agentic_transcoder import RunResult, TestError
-
-        assert RunResult is not None
-        assert TestError is not None
-
-    def test_legacy_agents_not_exported(self):
-        import agentic_transcoder
+    def test_types_exported(self, at):
+        assert at.package.RunResult is not None
+        assert at.package.TestError is not None
 
+    def test_legacy_agents_not_exported(self, at):
         # analyzer, planner, critic are REMOVED
-        assert not hasattr(agentic_transcoder, "analyzer")
-        assert not hasattr(agentic_transcoder, "planner")
-        assert not hasattr(agentic_transcoder, "critic")
-
-    def test_legacy_types_not_exported(self):
-        import agentic_transcoder
+        assert not hasattr(at.package, "analyzer")
+        assert not hasattr(at.package, "planner")
+        assert not hasattr(at.package, "critic")
 
+    def test_legacy_types_not_exported(self, at):
         # Verdict, Diagnosis, TestPlan are REMOVED
-        assert not hasattr(agentic_transcoder, "Verdict")
-        assert not hasattr(agentic_transcoder, "Diagnosis")
-        assert not hasattr(agentic_transcoder, "TestPlan")
+        assert not hasattr(at.package, "Verdict")
+        assert not hasattr(at.package, "Diagnosis")
+        assert not hasattr(at.package, "TestPlan")
 
 
 class TestDirectories:
@@ -301,28 +267,19 @@ class TestDirectories:
 class TestConsole:
     """Test console module for CLI output."""
 
-    def test_console_module_exists(self):
-        from agentic_transcoder.console import display, handler
+    def test_console_module_exists(self, at):
+        assert hasattr(at.display, "TranscoderDisplay")
+        assert hasattr(at.handler, "create_handler")
 
-        assert hasattr(display, "TranscoderDisplay")
-        assert hasattr(handler, "create_handler")
-
-    def test_create_handler_returns_tuple(self):
-        from rich.console import Console
-
-        from agentic_transcoder.console import create_handler
-
-        console = Console()
-        disp, hdlr = create_handler(console)
+    def test_create_handler_returns_tuple(self, at):
+        disp, hdlr = at.create_handler(Console())
 
         assert disp is not None
         assert callable(hdlr)
 
-    def test_phase_labels_for_five_phases(self):
-        from agentic_transcoder.console.display import TranscoderDisplay
-
-        assert "🚀 Generate" in TranscoderDisplay.PHASE_LABELS
-        assert "💫 Improve" in TranscoderDisplay.PHASE_LABELS
-        assert "🔧 Fix" in TranscoderDisplay.PHASE_LABELS
-        assert "🧪 Test" in TranscoderDisplay.PHASE_LABELS
-        assert "💎 Reflect" in TranscoderDisplay.PHASE_LABELS
+    def test_phase_labels_for_five_phases(self, at):
+        assert "🚀 Generate" in at.display.TranscoderDisplay.PHASE_LABELS
+        assert "💫 Improve" in at.display.TranscoderDisplay.PHASE_LABELS
+        assert "🔧 Fix" in at.display.TranscoderDisplay.PHASE_LABELS
+        assert "🧪 Test" in at.display.TranscoderDisplay.PHASE_LABELS
+        assert "💎 Reflect" in at.display.TranscoderDisplay.PHASE_LABELS
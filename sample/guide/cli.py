@@ -10,20 +10,31 @@ Classic Macintosh style with modern Textual widgets.
 from __future__ import annotations
 
 import asyncio
-import json
 import pathlib
 import sqlite3
 import sys
 import uuid
+from collections.abc import Callable
+from typing import Any
 
 from dotenv import load_dotenv
+from openai.types.responses import (
+    ResponseReasoningSummaryTextDeltaEvent,
+    ResponseReasoningTextDeltaEvent,
+    ResponseTextDeltaEvent,
+)
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json decodes the same rows
+    from json import loads as json_loads
 
 load_dotenv(pathlib.Path(__file__).parent.parent / ".env.local")
 
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.parent / "src"))
 
-from agentic_flow import Runner
-from agents import SQLiteSession
+from agentic_flow import PhaseStarted, Runner
+from agents import RawResponsesStreamEvent, SQLiteSession
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.text import Text
@@ -43,12 +54,22 @@ from textual.widgets import (
     TabPane,
 )
 
-from .flow import guide_flow
+from .flow import guide_flow, load_instructions
 
 DATA_DIR = pathlib.Path(__file__).parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
 DB_PATH = DATA_DIR / "cli_session.db"
 LAST_SESSION_FILE = DATA_DIR / "last_session_id.txt"
+TEXT_PART_TYPES = frozenset({"input_text", "output_text"})
+HISTORY_SQL = "SELECT message_data FROM agent_messages WHERE session_id = ? ORDER BY id"
+# Streamed delta payload type -> whether it belongs in the reasoning panel.
+DELTA_IS_REASONING: dict[type, bool] = {
+    ResponseTextDeltaEvent: False,
+    ResponseReasoningSummaryTextDeltaEvent: True,
+    ResponseReasoningTextDeltaEvent: True,
+}
+
+history_connections: dict[str, sqlite3.Connection] = {}
 
 
 def get_last_session_id() -> str:
@@ -65,38 +86,63 @@ def create_new_session_id() -> str:
     return session_id
 
 
-def load_chat_history(session_id: str, db_path: pathlib.Path) -> list[dict]:
+def history_connection(db_path: pathlib.Path) -> sqlite3.Connection:
+    """Return the cached read-only connection used to read chat history.
+
+    Opened with mode=ro so it never changes the journal mode or other
+    settings of the database SQLiteSession writes to.
+    """
+    key = str(db_path)
+    conn = history_connections.get(key)
+    if conn is None:
+        conn = sqlite3.connect(
+            f"{db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        history_connections[key] = conn
+    return conn
+
+
+def close_history_connections() -> None:
+    """Close every cached history connection."""
+    while history_connections:
+        history_connections.popitem()[1].close()
+
+
+def load_chat_history(session_id: str, db_path: pathlib.Path) -> tuple[list[str], list[str]]:
     """Load chat history from SQLiteSession database.
 
-    Returns list of {"role": "user"|"assistant", "content": str}.
+    Returns parallel lists (roles, contents), where roles[i] is "user" or
+    "assistant" and contents[i] is that message's text.
     """
     if not db_path.exists():
-        return []
+        return [], []
 
     try:
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            "SELECT message_data FROM agent_messages WHERE session_id = ? ORDER BY id",
-            (session_id,),
-        ).fetchall()
-        conn.close()
-
-        messages = []
-        for row in rows:
-            data = json.loads(row["message_data"])
+        roles: list[str] = []
+        contents: list[str] = []
+        for (raw,) in history_connection(db_path).execute(HISTORY_SQL, (session_id,)):
+            data = json_loads(raw)
             role = data.get("role", "")
-            content_parts = data.get("content", [])
-            text = ""
-            for part in content_parts:
-                if part.get("type") in ("input_text", "output_text"):
-                    text += part.get("text", "")
+            text = "".join(
+                part.get("text", "")
+                for part in data.get("content", ())
+                if part.get("type") in TEXT_PART_TYPES
+            )
             if text:
-                messages.append({"role": role, "content": text})
-        return messages
+                roles.append(role)
+                contents.append(text)
+        return roles, contents
     except Exception:
-        return []
+        return [], []
+
 
+MESSAGE_PANEL = {"title_align": "left", "border_style": "bright_black"}
+REASONING_PANEL = {"title_align": "left", "border_style": "yellow"}
+STREAMING_PANEL = {"title_align": "left", "border_style": "dim"}
+USER_PANEL = {"title": "You", **MESSAGE_PANEL}
 
 HAPPY_MAC = """
      ┌─────────┐
@@ -126,14 +172,16 @@ class GuideApp(App):
         self.reasoning_text = ""
         self.streaming_text = ""
         self.is_streaming = False
+        self.stream_dirty = False
         self.current_user_input = ""
         self.current_phase_label = ""
+        self.event_callback: Callable[[Any], None] | None = None
         self.session_id = get_last_session_id()
         self.session = SQLiteSession(
             session_id=self.session_id,
             db_path=str(DB_PATH),
         )
-        self.runner = Runner(flow=guide_flow, session=self.session)
+        self.runner = Runner(flow=guide_flow, session=self.session, handler=self.dispatch_event)
 
     def create_new_session(self) -> None:
         """Create a new chat session."""
@@ -142,7 +190,12 @@ class GuideApp(App):
             session_id=self.session_id,
             db_path=str(DB_PATH),
         )
-        self.runner = Runner(flow=guide_flow, session=self.session)
+        self.runner = Runner(flow=guide_flow, session=self.session, handler=self.dispatch_event)
+
+    def dispatch_event(self, event: Any) -> None:
+        """Forward runner events to the handler of the in-flight request, if any."""
+        if self.event_callback is not None:
+            self.event_callback(event)
 
     def compose(self) -> ComposeResult:
         with Horizontal(id="menu-bar"):
@@ -185,37 +238,37 @@ class GuideApp(App):
     def on_mount(self) -> None:
         self.query_one("#progress", ProgressBar).update(total=100, progress=0)
         self.load_history()
+        self.warm_instructions()
         self.set_timer(0.1, self.focus_input)
 
+    @work(group="warmup")
+    async def warm_instructions(self) -> None:
+        """Build the agent instructions off the event loop before the first message."""
+        await asyncio.to_thread(load_instructions)
+
+    def on_unmount(self) -> None:
+        close_history_connections()
+
     def load_history(self) -> None:
         """Load and display chat history from previous sessions."""
-        history = load_chat_history(self.session_id, DB_PATH)
-        if not history:
+        roles, contents = load_chat_history(self.session_id, DB_PATH)
+        if not roles:
             return
 
         chat_log = self.query_one("#chat-log", RichLog)
-        for msg in history:
-            if msg["role"] == "user":
+        for role, content in zip(roles, contents):
+            if role == "user":
+                chat_log.write(Panel(Text(content), **USER_PANEL))
+            elif role == "assistant":
                 chat_log.write(
                     Panel(
-                        Text(msg["content"]),
-                        title="You",
-                        title_align="left",
-                        border_style="bright_black",
-                    )
-                )
-            elif msg["role"] == "assistant":
-                chat_log.write(
-                    Panel(
-                        Markdown(msg["content"]),
+                        Markdown(content),
                         title="Guide",
-                        title_align="left",
-                        border_style="bright_black",
+                        **MESSAGE_PANEL,
                     )
                 )
 
-        if history:
-            self.query_one(TabbedContent).active = "tab-chat"
+        self.query_one(TabbedContent).active = "tab-chat"
 
     def focus_input(self) -> None:
         self.query_one("#user-input", Input).focus()
@@ -237,16 +290,7 @@ class GuideApp(App):
         event.input.value = ""
 
         self.query_one(TabbedContent).active = "tab-chat"
-        chat_log = self.query_one("#chat-log", RichLog)
-
-        chat_log.write(
-            Panel(
-                Text(user_input),
-                title="You",
-                title_align="left",
-                border_style="bright_black",
-            )
-        )
+        self.write_user_panel(self.query_one("#chat-log", RichLog), user_input)
 
         self.reasoning_text = ""
         self.streaming_text = ""
@@ -275,8 +319,7 @@ class GuideApp(App):
                     Panel(
                         Markdown(self.reasoning_text),
                         title=f"{label} (reasoning)",
-                        title_align="left",
-                        border_style="yellow",
+                        **REASONING_PANEL,
                     )
                 )
 
@@ -285,8 +328,7 @@ class GuideApp(App):
                 Panel(
                     Markdown(response_text),
                     title=label,
-                    title_align="left",
-                    border_style="bright_black",
+                    **MESSAGE_PANEL,
                 )
             )
 
@@ -302,69 +344,84 @@ class GuideApp(App):
             progress.update(progress=0)
 
     def write_user_panel(self, chat_log: RichLog, user_input: str) -> None:
-        chat_log.write(
-            Panel(
-                Text(user_input),
-                title="You",
-                title_align="left",
-                border_style="bright_black",
-            )
-        )
+        chat_log.write(Panel(Text(user_input), **USER_PANEL))
+
+    def render_stream(self) -> None:
+        """Redraw the in-flight reasoning/response panels if new deltas arrived."""
+        if not self.stream_dirty:
+            return
+        self.stream_dirty = False
+
+        chat_log = self.query_one("#chat-log", RichLog)
+        label = self.current_phase_label or "Guide"
+
+        # One batch per frame: clear + rewrite reflows the log once, not per write.
+        with self.batch_update():
+            chat_log.clear()
+            self.write_user_panel(chat_log, self.current_user_input)
+            if self.reasoning_text:
+                reasoning_state = "reasoning" if self.streaming_text else "reasoning..."
+                chat_log.write(
+                    Panel(
+                        Markdown(self.reasoning_text),
+                        title=f"{label} ({reasoning_state})",
+                        **REASONING_PANEL,
+                    )
+                )
+            if self.streaming_text:
+                chat_log.write(
+                    Panel(
+                        Markdown(self.streaming_text),
+                        title=f"{label} (streaming...)",
+                        **STREAMING_PANEL,
+                    )
+                )
 
     async def execute_guide(self, user_input: str) -> str:
         progress = self.query_one("#progress", ProgressBar)
-        chat_log = self.query_one("#chat-log", RichLog)
+        last_progress = 0
 
-        def handle_event(event) -> None:
-            if hasattr(event, "label") and not hasattr(event, "elapsed_ms"):
+        def handle_event(event: Any) -> None:
+            nonlocal last_progress
+            event_class = type(event)
+            if event_class is PhaseStarted:
                 self.current_phase_label = event.label
-
-            label = self.current_phase_label or "Guide"
-            event_type = getattr(event, "type", None)
-
-            if hasattr(event, "data") and hasattr(event.data, "delta"):
-                delta = event.data.delta
-
-                if event_type and "reasoning" in event_type:
-                    self.reasoning_text += delta
-                    chat_log.clear()
-                    self.write_user_panel(chat_log, self.current_user_input)
-                    chat_log.write(
-                        Panel(
-                            Markdown(self.reasoning_text),
-                            title=f"{label} (reasoning...)",
-                            title_align="left",
-                            border_style="yellow",
-                        )
-                    )
-                else:
-                    self.streaming_text += delta
-                    total = len(self.reasoning_text) + len(self.streaming_text)
-                    current = min(20 + total // 10, 95)
+                return
+            if event_class is not RawResponsesStreamEvent:
+                return
+
+            data = event.data
+            is_reasoning = DELTA_IS_REASONING.get(type(data))
+            if is_reasoning is None:
+                # Other delta payloads (e.g. tool-call arguments) go to the response.
+                delta = getattr(data, "delta", None)
+                if not isinstance(delta, str):
+                    return
+                is_reasoning = False
+            else:
+                delta = data.delta
+
+            if is_reasoning:
+                self.reasoning_text += delta
+            else:
+                self.streaming_text += delta
+                total = len(self.reasoning_text) + len(self.streaming_text)
+                current = min(20 + total // 10, 95)
+                if current != last_progress:
+                    last_progress = current
                     progress.update(progress=current)
+            # Deltas only accumulate text. The first one after a redraw schedules
+            # the next, so the panels are rebuilt at most once per screen refresh.
+            if not self.stream_dirty:
+                self.stream_dirty = True
+                self.call_after_refresh(self.render_stream)
 
-                    chat_log.clear()
-                    self.write_user_panel(chat_log, self.current_user_input)
-                    if self.reasoning_text:
-                        chat_log.write(
-                            Panel(
-                                Markdown(self.reasoning_text),
-                                title=f"{label} (reasoning)",
-                                title_align="left",
-                                border_style="yellow",
-                            )
-                        )
-                    chat_log.write(
-                        Panel(
-                            Markdown(self.streaming_text),
-                            title=f"{label} (streaming...)",
-                            title_align="left",
-                            border_style="dim",
-                        )
-                    )
-
-        runner = Runner(flow=guide_flow, session=self.session, handler=handle_event)
-        return await runner(user_input)
+        self.event_callback = handle_event
+        try:
+            return await self.runner(user_input)
+        finally:
+            self.event_callback = None
+            self.stream_dirty = False
 
     def action_clear(self) -> None:
         chat_log = self.query_one("#chat-log", RichLog)
@@ -381,9 +438,24 @@ class GuideApp(App):
                 worker.cancel()
 
 
+def new_event_loop() -> asyncio.AbstractEventLoop | None:
+    """Create a uvloop event loop, or None for Textual's default loop.
+
+    uvloop ships with uvicorn[standard] on non-Windows platforms and cuts
+    per-delta scheduling overhead while streaming.
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop()
+
+
 def main() -> None:
     app = GuideApp()
-    app.run()
+    app.run(loop=new_event_loop())
 
 
 if __name__ == "__main__":
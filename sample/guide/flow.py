@@ -9,9 +9,15 @@ Just good instructions and complete context.
 
 from __future__ import annotations
 
+import hashlib
+import io
 import os
 import pathlib
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
 
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.parent / "src"))
 
@@ -21,45 +27,79 @@ PROJECT_ROOT = pathlib.Path(__file__).parent.parent.parent
 SRC_DIR = PROJECT_ROOT / "src" / "agentic_flow"
 DOCS_DIR = PROJECT_ROOT / "docs" / "en"
 README = PROJECT_ROOT / "README.md"
+DATA_DIR = pathlib.Path(__file__).parent / "data"
 
 MODEL = os.getenv("MODEL_NAME", "gpt-5.2")
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
-def load_docs() -> str:
-    """Load documentation files from docs/en/."""
-    docs = []
-    if DOCS_DIR.exists():
-        for md_file in sorted(DOCS_DIR.rglob("*.md")):
-            relative_path = md_file.relative_to(DOCS_DIR)
-            docs.append(f"# {relative_path}\n\n{md_file.read_text()}")
-    if README.exists():
-        docs.append(f"# README.md\n\n{README.read_text()}")
-    return "\n\n---\n\n".join(docs)
+def find_files(root: pathlib.Path, suffix: str, *, recursive: bool = True) -> list[str]:
+    """Paths of files under root ending in suffix, ordered like sorted(rglob()).
 
+    Walks with os.scandir and tests names on the raw DirEntry, so no Path
+    objects are built during discovery.
+    """
+    found: list[str] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    found.append(entry.path)
+    found.sort(key=lambda path: path.split(os.sep))
+    return found
 
-def load_source_code() -> str:
-    """Load all source code files."""
-    code_parts = []
-    for py_file in sorted(SRC_DIR.glob("*.py")):
-        content = py_file.read_text()
-        code_parts.append(f"## {py_file.name}\n\n```python\n{content}```")
-    return "\n\n".join(code_parts)
 
+def read_utf8(path: str) -> str:
+    """Read a UTF-8 file without the text-IO wrapper or newline translation."""
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
 
-DOCS_CONTENT = load_docs()
-CODE_CONTENT = load_source_code()
 
-INSTRUCTIONS = f"""# Reference Material
+def read_files(files: list[str]) -> list[str]:
+    """Read files concurrently, returning contents in input order."""
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        return list(pool.map(read_utf8, files))
 
-## Documentation
-{DOCS_CONTENT}
 
-## Source Code
-{CODE_CONTENT}
+def load_docs() -> str:
+    """Load documentation files from docs/en/."""
+    files = find_files(DOCS_DIR, ".md") if DOCS_DIR.exists() else []
+    prefix = len(str(DOCS_DIR)) + 1
+    names = [md_file[prefix:] for md_file in files]
+    if README.exists():
+        files.append(str(README))
+        names.append("README.md")
+    buf = io.StringIO()
+    for i, (name, text) in enumerate(zip(names, read_files(files))):
+        if i:
+            buf.write("\n\n---\n\n")
+        buf.write("# ")
+        buf.write(name)
+        buf.write("\n\n")
+        buf.write(text)
+    return buf.getvalue()
+
+
+def load_source_code() -> str:
+    """Load all source code files."""
+    files = find_files(SRC_DIR, ".py", recursive=False)
+    buf = io.StringIO()
+    for i, (py_file, content) in enumerate(zip(files, read_files(files))):
+        if i:
+            buf.write("\n\n")
+        buf.write("## ")
+        buf.write(os.path.basename(py_file))
+        buf.write("\n\n```python\n")
+        buf.write(content)
+        buf.write("```")
+    return buf.getvalue()
 
----
 
-# Instructions
+GUIDANCE = """# Instructions
 
 You are an expert on AF (Agentic Flow), a thin orchestration layer for the OpenAI Agents SDK.
 
@@ -102,9 +142,75 @@ If the user writes in Japanese, respond in Japanese.
 If the user writes in English, respond in English.
 """
 
+
+def build_instructions() -> str:
+    """Build instructions from documentation and source code."""
+    return f"""# Reference Material
+
+## Documentation
+{load_docs()}
+
+## Source Code
+{load_source_code()}
+
+---
+
+{GUIDANCE}"""
+
+
+def input_fingerprint() -> str:
+    """Hash (path, mtime, size) of every file that feeds the instructions.
+
+    This module is included too: editing GUIDANCE or build_instructions()
+    must invalidate the cache.
+    """
+    files = [__file__]
+    files += find_files(DOCS_DIR, ".md") if DOCS_DIR.exists() else []
+    files += find_files(SRC_DIR, ".py", recursive=False)
+    if README.exists():
+        files.append(str(README))
+    h = hashlib.blake2b(GUIDANCE.encode())
+    for path in files:
+        stat = os.stat(path)
+        h.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return h.hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
+def load_instructions() -> str:
+    """Load instructions from the on-disk cache, rebuilding when inputs change."""
+    cache = DATA_DIR / f"guide_instructions_{input_fingerprint()}.txt"
+    if cache.exists():
+        return cache.read_text(encoding="utf-8")
+
+    instructions = build_instructions()
+    try:
+        DATA_DIR.mkdir(exist_ok=True)
+        # Write aside and rename, so a concurrent reader never sees a partial file.
+        fd, tmp = tempfile.mkstemp(dir=DATA_DIR, prefix=".guide_instructions_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(instructions)
+            os.replace(tmp, cache)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        for stale in DATA_DIR.glob("guide_instructions_*.txt"):
+            if stale != cache:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+    return instructions
+
+
+def instructions(context: Any, agent: Any) -> str:
+    """Dynamic instructions: materialized on the first agent run, not at import."""
+    return load_instructions()
+
+
 guide_agent = Agent(
     name="agenticflow",
-    instructions=INSTRUCTIONS,
+    instructions=instructions,
     model=MODEL,
     model_settings=reasoning("medium"),
 )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import sqlite3
 from datetime import UTC, datetime
 from pathlib import Path
@@ -15,6 +14,60 @@ DATA_DIR = Path(__file__).parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
 DB_PATH = DATA_DIR / "guide.db"
 
+_THREAD_ITEM_ADAPTER: TypeAdapter[ThreadItem] = TypeAdapter(ThreadItem)
+
+_SQL_SETUP = """
+    CREATE TABLE IF NOT EXISTS threads (
+        id TEXT PRIMARY KEY,
+        title TEXT,
+        created_at TEXT NOT NULL,
+        metadata TEXT
+    );
+    CREATE TABLE IF NOT EXISTS items (
+        id TEXT PRIMARY KEY,
+        thread_id TEXT NOT NULL,
+        type TEXT NOT NULL,
+        data BLOB NOT NULL,
+        created_at TEXT NOT NULL,
+        FOREIGN KEY (thread_id) REFERENCES threads(id)
+    );
+    DROP INDEX IF EXISTS idx_items_thread;
+    CREATE INDEX IF NOT EXISTS idx_threads_created ON threads(created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_items_thread_created ON items(thread_id, created_at, id);
+"""
+# Thread metadata is never populated; store the serialized empty object as-is.
+_EMPTY_METADATA = "{}"
+_SQL_SELECT_THREAD = "SELECT * FROM threads WHERE id = ?"
+_SQL_INSERT_THREAD = """INSERT OR REPLACE INTO threads (id, title, created_at, metadata)
+    VALUES (?, ?, ?, ?)"""
+_SQL_INSERT_ITEM = """INSERT OR REPLACE INTO items (id, thread_id, type, data, created_at)
+    VALUES (?, ?, ?, ?, ?)"""
+# Keyset pagination: `after` is the id of the last row of the previous page.
+# (created_at, id) orders rows totally, so equal timestamps are not skipped.
+# If the `after` row has since been deleted, the subquery yields NULL, the
+# comparison is never true, and the page is empty with has_more=False.
+_SQL_LOAD_THREADS = {
+    order: f"""SELECT * FROM threads
+        WHERE :after IS NULL
+           OR (created_at, id) {op} (SELECT created_at, id FROM threads WHERE id = :after)
+        ORDER BY created_at {order.upper()}, id {order.upper()}
+        LIMIT :limit"""
+    for order, op in (("asc", ">"), ("desc", "<"))
+}
+_SQL_LOAD_ITEMS = {
+    order: f"""SELECT id, data FROM items
+        WHERE thread_id = :thread_id
+          AND (:after IS NULL
+               OR (created_at, id) {op} (SELECT created_at, id FROM items WHERE id = :after))
+        ORDER BY created_at {order.upper()}, id {order.upper()}
+        LIMIT :limit"""
+    for order, op in (("asc", ">"), ("desc", "<"))
+}
+_SQL_SELECT_ITEM = "SELECT data FROM items WHERE id = ? AND thread_id = ?"
+_SQL_DELETE_THREAD_ITEMS = "DELETE FROM items WHERE thread_id = ?"
+_SQL_DELETE_THREAD = "DELETE FROM threads WHERE id = ?"
+_SQL_DELETE_ITEM = "DELETE FROM items WHERE id = ? AND thread_id = ?"
+
 
 class SQLiteStore(Store[dict]):
     """SQLite-based store for ChatKit with persistence."""
@@ -26,35 +79,17 @@ class SQLiteStore(Store[dict]):
         self.setup_tables()
 
     def setup_tables(self) -> None:
-        self.conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS threads (
-                id TEXT PRIMARY KEY,
-                title TEXT,
-                created_at TEXT NOT NULL,
-                metadata TEXT
-            );
-            CREATE TABLE IF NOT EXISTS items (
-                id TEXT PRIMARY KEY,
-                thread_id TEXT NOT NULL,
-                type TEXT NOT NULL,
-                data TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (thread_id) REFERENCES threads(id)
-            );
-            CREATE INDEX IF NOT EXISTS idx_items_thread ON items(thread_id);
-        """
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.executescript(_SQL_SETUP)
 
-    def serialize_item(self, item: ThreadItem) -> str:
-        return item.model_dump_json()
+    def serialize_item(self, item: ThreadItem) -> bytes:
+        return item.__pydantic_serializer__.to_json(item)
 
-    def deserialize_item(self, data: str) -> ThreadItem:
-        return TypeAdapter(ThreadItem).validate_json(data)
+    def deserialize_item(self, data: bytes | str) -> ThreadItem:
+        return _THREAD_ITEM_ADAPTER.validate_json(data)
 
     async def load_thread(self, thread_id: str, context: dict) -> ThreadMetadata:
-        row = self.conn.execute("SELECT * FROM threads WHERE id = ?", (thread_id,)).fetchone()
+        row = self.conn.execute(_SQL_SELECT_THREAD, (thread_id,)).fetchone()
         if not row:
             thread = ThreadMetadata(
                 id=thread_id,
@@ -62,94 +97,93 @@ class SQLiteStore(Store[dict]):
             )
             await self.save_thread(thread, context)
             return thread
-        return ThreadMetadata(
+        # Rows were validated on write; skip re-validation on the read path.
+        return ThreadMetadata.model_construct(
             id=row["id"],
             title=row["title"],
             created_at=datetime.fromisoformat(row["created_at"]),
         )
 
     async def save_thread(self, thread: ThreadMetadata, context: dict) -> None:
-        self.conn.execute(
-            """INSERT OR REPLACE INTO threads (id, title, created_at, metadata)
-               VALUES (?, ?, ?, ?)""",
-            (
-                thread.id,
-                thread.title,
-                thread.created_at.isoformat(),
-                json.dumps({}),
-            ),
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(
+                _SQL_INSERT_THREAD,
+                (
+                    thread.id,
+                    thread.title,
+                    thread.created_at.isoformat(),
+                    _EMPTY_METADATA,
+                ),
+            )
 
     async def load_threads(
         self, limit: int, after: str | None, order: str, context: dict
     ) -> Page[ThreadMetadata]:
-        order_dir = "DESC" if order == "desc" else "ASC"
-        rows = self.conn.execute(
-            f"SELECT * FROM threads ORDER BY created_at {order_dir} LIMIT ?",
-            (limit + 1,),
-        ).fetchall()
+        limit = max(limit, 0)
+        sql = _SQL_LOAD_THREADS["desc" if order == "desc" else "asc"]
+        rows = self.conn.execute(sql, {"after": after, "limit": limit + 1}).fetchall()
+        page = rows[:limit]
 
         threads = [
-            ThreadMetadata(
+            ThreadMetadata.model_construct(
                 id=row["id"],
                 title=row["title"],
                 created_at=datetime.fromisoformat(row["created_at"]),
             )
-            for row in rows[:limit]
+            for row in page
         ]
-        return Page(data=threads, has_more=len(rows) > limit, after=None)
+        has_more = len(rows) > limit
+        # An empty page (limit=0) keeps the incoming cursor.
+        next_after = (page[-1]["id"] if page else after) if has_more else None
+        return Page(data=threads, has_more=has_more, after=next_after)
 
     async def load_thread_items(
         self, thread_id: str, after: str | None, limit: int, order: str, context: dict
     ) -> Page[ThreadItem]:
-        order_dir = "DESC" if order == "desc" else "ASC"
+        limit = max(limit, 0)
+        sql = _SQL_LOAD_ITEMS["desc" if order == "desc" else "asc"]
         rows = self.conn.execute(
-            f"""SELECT data FROM items
-                WHERE thread_id = ?
-                ORDER BY created_at {order_dir}
-                LIMIT ?""",
-            (thread_id, limit + 1),
+            sql, {"thread_id": thread_id, "after": after, "limit": limit + 1}
         ).fetchall()
 
-        items = [self.deserialize_item(row["data"]) for row in rows[:limit]]
-        return Page(data=items, has_more=len(rows) > limit, after=None)
+        page = rows[:limit]
+        items = [self.deserialize_item(row["data"]) for row in page]
+        has_more = len(rows) > limit
+        # An empty page (limit=0) keeps the incoming cursor.
+        next_after = (page[-1]["id"] if page else after) if has_more else None
+        return Page(data=items, has_more=has_more, after=next_after)
 
     async def add_thread_item(self, thread_id: str, item: ThreadItem, context: dict) -> None:
         created_at = getattr(item, "created_at", datetime.now(UTC))
-        self.conn.execute(
-            """INSERT OR REPLACE INTO items (id, thread_id, type, data, created_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            (
-                item.id,
-                thread_id,
-                type(item).__name__,
-                self.serialize_item(item),
-                created_at.isoformat(),
-            ),
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(
+                _SQL_INSERT_ITEM,
+                (
+                    item.id,
+                    thread_id,
+                    type(item).__name__,
+                    self.serialize_item(item),
+                    created_at.isoformat(),
+                ),
+            )
 
     async def save_item(self, thread_id: str, item: ThreadItem, context: dict) -> None:
         await self.add_thread_item(thread_id, item, context)
 
     async def load_item(self, thread_id: str, item_id: str, context: dict) -> ThreadItem:
-        row = self.conn.execute(
-            "SELECT data FROM items WHERE id = ? AND thread_id = ?",
-            (item_id, thread_id),
-        ).fetchone()
+        row = self.conn.execute(_SQL_SELECT_ITEM, (item_id, thread_id)).fetchone()
         if not row:
             raise NotFoundError(f"Item {item_id} not found")
         return self.deserialize_item(row["data"])
 
     async def delete_thread(self, thread_id: str, context: dict) -> None:
-        self.conn.execute("DELETE FROM items WHERE thread_id = ?", (thread_id,))
-        self.conn.execute("DELETE FROM threads WHERE id = ?", (thread_id,))
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(_SQL_DELETE_THREAD_ITEMS, (thread_id,))
+            self.conn.execute(_SQL_DELETE_THREAD, (thread_id,))
 
     async def delete_thread_item(self, thread_id: str, item_id: str, context: dict) -> None:
-        self.conn.execute("DELETE FROM items WHERE id = ? AND thread_id = ?", (item_id, thread_id))
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(_SQL_DELETE_ITEM, (item_id, thread_id))
 
     async def save_attachment(self, attachment: Attachment, context: dict) -> None:
         raise NotImplementedError("Attachments not supported")
@@ -13,7 +13,9 @@ import asyncio
 import sys
 from pathlib import Path
 
+from agents import RawResponsesStreamEvent
 from dotenv import load_dotenv
+from openai.types.responses import ResponseTextDeltaEvent
 
 load_dotenv(Path(__file__).parent / ".env.local")
 
@@ -154,9 +156,13 @@ await assistant("...").silent()    # No UI output"""
 
     console.print("\n[dim]Streaming demo...[/dim]")
 
+    out = console.file
+
     def streaming_handler(event) -> None:
-        if hasattr(event, "data") and hasattr(event.data, "delta"):
-            console.print(event.data.delta, end="")
+        # Exact type checks instead of hasattr probes; raw writes skip Rich markup parsing.
+        if type(event) is RawResponsesStreamEvent and type(event.data) is ResponseTextDeltaEvent:
+            out.write(event.data.delta)
+            out.flush()
 
     async def streaming_flow(msg: str) -> str:
         async with phase("Streaming"):
@@ -205,5 +211,21 @@ async def main() -> None:
     console.print("\n[dim]Done.[/dim]\n")
 
 
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop event loop when available, else asyncio's default.
+
+    uvloop is optional (it ships with uvicorn[standard] on non-Windows
+    platforms) and lowers per-await overhead while deltas stream in.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=new_event_loop)
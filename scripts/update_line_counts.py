@@ -13,13 +13,17 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 EXAMPLES_DIR = PROJECT_ROOT / "docs" / "examples"
 DOCS_DIR = PROJECT_ROOT / "docs" / "en"
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 LINE_COUNT_FILES = {
     "pure_sdk_chatkit.py": "Pure SDK",
@@ -28,11 +32,36 @@ LINE_COUNT_FILES = {
     "agenticflow_cli.py": "CLI",
 }
 
+# (compiled pattern, replacement template) pairs, compiled once at import.
+# Templates are filled from the example line counts for each run.
+LINE_COUNT_PATTERNS = [
+    (re.compile(pattern), template)
+    for pattern, template in [
+        (r"~\d+ lines of ceremony", "~{pure_sdk} lines of ceremony"),
+        (r"~\d+ lines :material-check:", "~{flow} lines :material-check:"),
+        (r"Pure SDK — ~\d+ lines", "Pure SDK — ~{pure_sdk} lines"),
+        (r"Flow — \d+ lines", "Flow — {flow} lines"),
+        (r"Flow Definition — \d+ lines", "Flow Definition — {flow} lines"),
+        (r"ChatKit Server — \d+ lines", "ChatKit Server — {chatkit} lines"),
+        (r"CLI — \d+ lines", "CLI — {cli} lines"),
+        (r"CLI Usage — \d+ lines", "CLI Usage — {cli} lines"),
+        (r"\| Lines of code \| ~\d+ \| ~\d+ \|", "| Lines of code | ~{pure_sdk} | ~{flow} |"),
+        (
+            r"\| \*\*Lines of code\*\* \| ~\d+ \| ~\d+ \|",
+            "| **Lines of code** | ~{pure_sdk} | ~{flow} |",
+        ),
+    ]
+]
+
 
 def count_lines(filepath: Path) -> int:
-    """Count non-empty lines in a file."""
-    content = filepath.read_text().strip()
-    return len(content.splitlines())
+    """Count lines in a file, ignoring leading/trailing blank lines.
+
+    Counts newlines in the raw bytes instead of decoding and splitting into a
+    throwaway list of lines.
+    """
+    data = filepath.read_bytes().strip()
+    return data.count(b"\n") + 1 if data else 0
 
 
 def get_line_counts() -> dict[str, int]:
@@ -45,44 +74,45 @@ def get_line_counts() -> dict[str, int]:
     return counts
 
 
-def update_markdown_file(filepath: Path, counts: dict[str, int], check_only: bool) -> bool:
+def find_markdown_files(root: Path) -> list[Path]:
+    """List markdown files under root.
+
+    Walks with os.walk and filters names as plain strings, building a Path
+    only for the files that match.
+    """
+    return [
+        Path(dirpath, name)
+        for dirpath, _, filenames in os.walk(root)
+        for name in filenames
+        if name.endswith(".md")
+    ]
+
+
+def update_markdown_file(filepath: Path, counts: dict[str, int], check_only: bool) -> Path | None:
     """Update line count references in a markdown file.
 
-    Returns True if file was modified (or would be modified in check mode).
+    Returns filepath if the file was modified (or would be modified in check
+    mode), else None. Runs on worker threads, so it does not print.
     """
     content = filepath.read_text()
     original = content
 
-    pure_sdk_count = counts.get("pure_sdk_chatkit.py", 120)
-    flow_count = counts.get("agenticflow_flow.py", 40)
-    chatkit_count = counts.get("agenticflow_chatkit.py", 15)
-    cli_count = counts.get("agenticflow_cli.py", 10)
-
-    replacements = [
-        (r"~\d+ lines of ceremony", f"~{pure_sdk_count} lines of ceremony"),
-        (r"~\d+ lines :material-check:", f"~{flow_count} lines :material-check:"),
-        (r"Pure SDK — ~\d+ lines", f"Pure SDK — ~{pure_sdk_count} lines"),
-        (r"Flow — \d+ lines", f"Flow — {flow_count} lines"),
-        (r"Flow Definition — \d+ lines", f"Flow Definition — {flow_count} lines"),
-        (r"ChatKit Server — \d+ lines", f"ChatKit Server — {chatkit_count} lines"),
-        (r"CLI — \d+ lines", f"CLI — {cli_count} lines"),
-        (r"CLI Usage — \d+ lines", f"CLI Usage — {cli_count} lines"),
-        (r"\| Lines of code \| ~\d+ \| ~\d+ \|", f"| Lines of code | ~{pure_sdk_count} | ~{flow_count} |"),
-        (r"\| \*\*Lines of code\*\* \| ~\d+ \| ~\d+ \|", f"| **Lines of code** | ~{pure_sdk_count} | ~{flow_count} |"),
-    ]
+    values = {
+        "pure_sdk": counts.get("pure_sdk_chatkit.py", 120),
+        "flow": counts.get("agenticflow_flow.py", 40),
+        "chatkit": counts.get("agenticflow_chatkit.py", 15),
+        "cli": counts.get("agenticflow_cli.py", 10),
+    }
 
-    for pattern, replacement in replacements:
-        content = re.sub(pattern, replacement, content)
+    for pattern, template in LINE_COUNT_PATTERNS:
+        content = pattern.sub(template.format_map(values), content)
 
     if content != original:
-        if check_only:
-            print(f"Would update: {filepath.relative_to(PROJECT_ROOT)}")
-            return True
-        filepath.write_text(content)
-        print(f"Updated: {filepath.relative_to(PROJECT_ROOT)}")
-        return True
+        if not check_only:
+            filepath.write_text(content)
+        return filepath
 
-    return False
+    return None
 
 
 def main() -> int:
@@ -102,10 +132,16 @@ def main() -> int:
         print(f"  {label}: {count} lines ({filename})")
     print()
 
-    modified = False
-    for md_file in DOCS_DIR.rglob("*.md"):
-        if update_markdown_file(md_file, counts, args.check):
-            modified = True
+    # Files are independent; overlap their reads/writes on a thread pool.
+    md_files = find_markdown_files(DOCS_DIR)
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+        results = pool.map(update_markdown_file, md_files, repeat(counts), repeat(args.check))
+        modified = sorted(path for path in results if path is not None)
+
+    # Report from the main thread in path order, so output is stable across runs.
+    action = "Would update" if args.check else "Updated"
+    for path in modified:
+        print(f"{action}: {path.relative_to(PROJECT_ROOT)}")
 
     if args.check and modified:
         print("\nLine counts need updating. Run without --check to apply.")
@@ -54,7 +54,7 @@ Context behavior:
     await agent("prompt").isolated()  # No Session, no PhaseSession
 """
 
-from .agent import Agent, ExecutionSpec
+from .agent import Agent, ExecutionSpec, gather_specs
 from .phase import PhaseSession, phase
 from .runner import RunHandle, Runner
 from .types import AgentResult, Event, Handler, PhaseEnded, PhaseStarted
@@ -63,6 +63,7 @@ from .utils import reasoning
 __all__ = [
     "Agent",
     "ExecutionSpec",
+    "gather_specs",
     "Runner",
     "RunHandle",
     "phase",
@@ -17,13 +17,20 @@ Design:
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+from collections.abc import Iterable
 from contextvars import ContextVar
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
 from agents import Agent as SDKAgent
 from agents import Runner
 
+from .chatkit import current_chatkit_context
+from .types import AgentResult
+
 if TYPE_CHECKING:
     from agents import Session
 
@@ -39,13 +46,25 @@ current_phase_session: ContextVar[PhaseSession | None] = ContextVar(
     "current_phase_session", default=None
 )
 
+# Set by phase(); defined here so resolve_input() reads them without importing phase.
+# Indicates whether execution is inside a phase (regardless of share_context)
+current_in_phase: ContextVar[bool] = ContextVar("current_in_phase", default=False)
+
+# Cached Session history for share_context=False phases (immutable snapshot)
+# This is set at phase start and cleared at phase end
+current_phase_session_history: ContextVar[tuple | None] = ContextVar(
+    "current_phase_session_history", default=None
+)
+
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True, weakref_slot=True)
 class ExecutionSpec(Generic[T]):
     """Awaitable execution specification.
 
     agent(prompt) returns this. Not executed until awaited.
     Returns T where T is determined by Agent's output_type.
+    eq=False keeps object identity equality and hashing, so specs can be
+    passed to asyncio.gather() and used in sets.
 
     Modifiers (5-axis model):
         WHERE: .isolated() - No Session/PhaseSession
@@ -72,17 +91,29 @@ class ExecutionSpec(Generic[T]):
     max_turns_sdk: int | None = None
     run_kwargs: dict[str, Any] = field(default_factory=dict)
 
-    def __hash__(self) -> int:
-        """Hash by object identity for asyncio.gather() compatibility."""
-        return id(self)
+    def copy_with(self, **changes: Any) -> ExecutionSpec[T]:
+        """Shallow copy with some fields replaced.
+
+        Modifiers call this instead of dataclasses.replace(), which walks
+        fields() and re-runs __init__ on every call in a modifier chain.
+        """
+        cls = type(self)
+        names = spec_field_names(cls)
+        if not names.issuperset(changes):
+            unknown = ", ".join(sorted(changes.keys() - names))
+            raise TypeError(f"{cls.__name__}.copy_with() got unknown field(s): {unknown}")
+        new = object.__new__(cls)
+        for name in names:
+            setattr(new, name, changes[name] if name in changes else getattr(self, name))
+        return new
 
     def stream(self) -> ExecutionSpec[T]:
         """Enable streaming mode. Execution occurs when this spec is awaited."""
-        return replace(self, streaming=True)
+        return self.copy_with(streaming=True)
 
     def max_turns(self, max_turns: int) -> ExecutionSpec[T]:
         """Set max_turns for this execution."""
-        return replace(self, max_turns_sdk=max_turns)
+        return self.copy_with(max_turns_sdk=max_turns)
 
     def silent(self) -> ExecutionSpec[T]:
         """Enable silent mode. Suppresses UI display only.
@@ -109,11 +140,11 @@ class ExecutionSpec(Generic[T]):
         - Background processing that shouldn't appear in UI
         - Internal tool calls that are implementation details
         """
-        return replace(self, is_silent=True)
+        return self.copy_with(is_silent=True)
 
     def isolated(self) -> ExecutionSpec[T]:
         """Enable isolated mode. No Session read/write, no PhaseSession."""
-        return replace(self, is_isolated=True)
+        return self.copy_with(is_isolated=True)
 
     def run_config(self, run_config: Any) -> ExecutionSpec[T]:
         """Set RunConfig for this execution.
@@ -128,8 +159,7 @@ class ExecutionSpec(Generic[T]):
                 RunConfig(tracing_disabled=True)
             )
         """
-        new_kwargs = {**self.run_kwargs, "run_config": run_config}
-        return replace(self, run_kwargs=new_kwargs)
+        return self.copy_with(run_kwargs={**self.run_kwargs, "run_config": run_config})
 
     def context(self, context: Any) -> ExecutionSpec[T]:
         """Set context for dependency injection.
@@ -146,8 +176,7 @@ class ExecutionSpec(Generic[T]):
             ctx = AppContext(user_id="123", db=db)
             result = await agent("prompt").context(ctx)
         """
-        new_kwargs = {**self.run_kwargs, "context": context}
-        return replace(self, run_kwargs=new_kwargs)
+        return self.copy_with(run_kwargs={**self.run_kwargs, "context": context})
 
     def run_kwarg(self, **kwargs: Any) -> ExecutionSpec[T]:
         """Set arbitrary SDK Runner.run() parameters.
@@ -161,41 +190,81 @@ class ExecutionSpec(Generic[T]):
                 conversation_id="conv_xyz",
             )
         """
-        new_kwargs = {**self.run_kwargs, **kwargs}
-        return replace(self, run_kwargs=new_kwargs)
+        return self.copy_with(run_kwargs={**self.run_kwargs, **kwargs})
 
     def __await__(self):
         return self.execute().__await__()
 
+    @staticmethod
+    async def run_batch_async(
+        specs: Iterable[ExecutionSpec[T]],
+        *,
+        concurrency: int = 8,
+    ) -> list[T | Exception]:
+        """Await many specs concurrently, at most `concurrency` in flight.
+
+        Results come back in input order. A spec raising an Exception does not
+        cancel the others; the exception is returned in its slot instead of
+        raised. BaseExceptions such as CancelledError propagate.
+
+        Example:
+            specs = [agent(x).isolated() for x in items]
+            results = await ExecutionSpec.run_batch_async(specs, concurrency=4)
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        specs = list(specs)
+        if len(specs) <= 1 or concurrency == 1:
+            # Nothing to overlap: await in this task, skipping Task/Semaphore setup.
+            results: list[T | Exception] = []
+            for spec in specs:
+                try:
+                    results.append(await spec)
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(spec: ExecutionSpec[T]) -> T | Exception:
+            async with semaphore:
+                try:
+                    return await spec
+                except Exception as e:
+                    return e
+
+        return await asyncio.gather(*(run_one(spec) for spec in specs))
+
     async def execute(self) -> T:
         """Execute the agent call. Returns T (str or Pydantic model)."""
-        from .chatkit import current_chatkit_context
+        chatkit_ctx = current_chatkit_context.get()
+        if self.streaming and chatkit_ctx is not None:
+            # ChatKitExecutionContext resolves input itself; don't resolve it twice.
+            return await chatkit_ctx.execute_spec(self)
 
         input_data, session = self.resolve_input()
 
         if self.streaming:
             output = await self.execute_streaming(input_data, session)
         else:
-            run_kwargs: dict = {"session": session, **self.run_kwargs}
-            if self.max_turns_sdk is not None:
-                run_kwargs["max_turns"] = self.max_turns_sdk
+            run_kwargs = self.sdk_run_kwargs(session)
             result = await Runner.run(self.sdk_agent, input_data, **run_kwargs)
             output = result.final_output
 
             # Non-streaming UI: handler (CLI) and ChatKit are mutually exclusive in practice.
             # ChatKit mode uses run_with_chatkit_context() which ignores Runner.handler.
             if not self.is_silent:
-                from .types import AgentResult
-
                 handler = self.resolve_handler()
                 event = AgentResult(content=output)
 
                 if handler:
-                    result = handler(event)
-                    if hasattr(result, "__await__"):
-                        await result
+                    if is_async_handler(handler):
+                        await handler(event)
+                    else:
+                        result = handler(event)
+                        if result is not None and inspect.isawaitable(result):
+                            await result
 
-                chatkit_ctx = current_chatkit_context.get()
                 if chatkit_ctx is not None:
                     await chatkit_ctx.emit_agent_result(output)
 
@@ -207,32 +276,53 @@ class ExecutionSpec(Generic[T]):
     async def execute_streaming(self, input_data: Any, session: Any) -> T:
         """Execute with streaming.
 
-        When ChatKit context is active, uses ChatKitExecutionContext.execute_spec()
-        to properly stream with workflow boundary management.
+        When ChatKit context is active, execute() routes to
+        ChatKitExecutionContext.execute_spec() instead, which streams with
+        workflow boundary management.
         Returns T (str or Pydantic model).
 
         When is_silent=True, events are not forwarded to handler.
         """
-        from .chatkit import current_chatkit_context
-
-        chatkit_ctx = current_chatkit_context.get()
-        if chatkit_ctx is not None:
-            return await chatkit_ctx.execute_spec(self)
-
         handler = self.resolve_handler() if not self.is_silent else None
-        run_kwargs: dict = {"session": session, **self.run_kwargs}
-        if self.max_turns_sdk is not None:
-            run_kwargs["max_turns"] = self.max_turns_sdk
+        run_kwargs = self.sdk_run_kwargs(session)
         stream = Runner.run_streamed(self.sdk_agent, input_data, **run_kwargs)
-
-        async for event in stream.stream_events():
-            if handler:
-                result = handler(event)
-                if hasattr(result, "__await__"):
-                    await result
+        events = stream.stream_events()
+
+        try:
+            # Pick the loop once per stream instead of probing each event's result.
+            if not handler:
+                async for _ in events:
+                    pass
+            elif is_async_handler(handler):
+                async for event in events:
+                    await handler(event)
+            else:
+                # Sync callables may still return an awaitable (e.g. a lambda
+                # wrapping an async method); await it like before.
+                async for event in events:
+                    result = handler(event)
+                    if result is not None and inspect.isawaitable(result):
+                        await result
+        except asyncio.CancelledError:
+            # Stop the SDK run so its in-flight model request is released now.
+            stream.cancel()
+            raise
 
         return stream.final_output
 
+    def sdk_run_kwargs(self, session: Any) -> dict[str, Any]:
+        """Keyword arguments for Runner.run() / Runner.run_streamed().
+
+        Plain specs (no .max_turns() and no SDK pass-through modifiers) skip
+        the merge and get a fresh {"session": session}.
+        """
+        if self.max_turns_sdk is None and not self.run_kwargs:
+            return {"session": session}
+        run_kwargs = {"session": session, **self.run_kwargs}
+        if self.max_turns_sdk is not None:
+            run_kwargs["max_turns"] = self.max_turns_sdk
+        return run_kwargs
+
     def resolve_input(self) -> tuple[Any, Any]:
         """Resolve input and session.
 
@@ -254,20 +344,17 @@ class ExecutionSpec(Generic[T]):
             return self.input, phase_session
 
         # Check if we're inside a phase with share_context=False
-        from .phase import current_in_phase, current_phase_session_history
-
         if current_in_phase.get():
             # share_context=False: read cached Session history, no write
             # Return as list (no session) to prevent SDK from writing
             cached_history = current_phase_session_history.get()
             if cached_history is not None:
+                # One list allocation: shared snapshot + this call's user message
                 user_message = {
                     "role": "user",
                     "content": [{"type": "input_text", "text": self.input}],
                 }
-                messages = list(cached_history)
-                messages.append(user_message)
-                return messages, None
+                return [*cached_history, user_message], None
             return self.input, None
 
         # Default: use Runner's global Session
@@ -279,6 +366,43 @@ class ExecutionSpec(Generic[T]):
         return current_handler.get()
 
 
+@lru_cache(maxsize=64)
+def spec_field_names(cls: type[ExecutionSpec[Any]]) -> frozenset[str]:
+    """Dataclass field names of an ExecutionSpec (sub)class, copied by copy_with().
+
+    Not cls.__slots__: on a subclass that lists only the subclass's own slots.
+    """
+    return frozenset(f.name for f in fields(cls))
+
+
+async def gather_specs(*specs: ExecutionSpec[Any]) -> list[Any]:
+    """Await specs concurrently; the first failure cancels the rest.
+
+    Unlike asyncio.gather(), siblings of a failed spec are cancelled instead
+    of running to completion, so their model requests stop early. Results
+    come back in argument order. Failures are raised as an ExceptionGroup.
+
+    Example:
+        async with phase("Research"):
+            summary, risks = await gather_specs(summarizer(doc), auditor(doc))
+    """
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(spec.execute()) for spec in specs]
+    return [task.result() for task in tasks]
+
+
+def is_async_handler(handler: Handler) -> bool:
+    """Whether calling handler always returns a coroutine that must be awaited.
+
+    Covers async functions, bound async methods, partials of either, and
+    objects whose __call__ is async. Other handlers may still return an
+    awaitable; callers check the result for those.
+    """
+    return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+        getattr(handler, "__call__", None)
+    )
+
+
 class Agent(Generic[T]):
     """AF Agent - callable SDK Agent wrapper.
 
@@ -308,6 +432,9 @@ class Agent(Generic[T]):
         # Pydantic output
         analyzer = Agent(name="analyzer", instructions="...", output_type=Analysis)
         result: Analysis = await analyzer("text")
+
+        # Batch
+        results = await analyzer.run_batch_async(texts, isolated=True)
     """
 
     @overload
@@ -365,3 +492,34 @@ class Agent(Generic[T]):
             sdk_agent=self.sdk_agent,
             input=input,
         )
+
+    def batch(self, inputs: Iterable[str]) -> list[ExecutionSpec[T]]:
+        """Create one ExecutionSpec[T] per input. Not executed yet."""
+        return [self(input) for input in inputs]
+
+    async def run_batch_async(
+        self,
+        inputs: Iterable[str],
+        *,
+        concurrency: int = 8,
+        stream: bool = False,
+        silent: bool = False,
+        isolated: bool = False,
+    ) -> list[T | Exception]:
+        """Run this agent over many inputs concurrently.
+
+        Each input becomes one ExecutionSpec with the given modifiers applied;
+        see ExecutionSpec.run_batch_async() for ordering and error semantics.
+        Use isolated=True unless the calls should share Session/PhaseSession.
+        """
+        specs = [
+            ExecutionSpec(
+                sdk_agent=self.sdk_agent,
+                input=input,
+                streaming=stream,
+                is_silent=silent,
+                is_isolated=isolated,
+            )
+            for input in inputs
+        ]
+        return await ExecutionSpec.run_batch_async(specs, concurrency=concurrency)
@@ -19,15 +19,21 @@ Workflow Boundary Design:
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator, Coroutine
+from collections import deque
+from collections.abc import AsyncIterator, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+from agents import Runner as SDKRunner
+
+from .utils import serialize_output
 
 if TYPE_CHECKING:
     from chatkit.agents import AgentContext
     from chatkit.store import Store
-    from chatkit.types import ThreadMetadata, ThreadStreamEvent
+    from chatkit.types import AssistantMessageItem, ThreadMetadata, ThreadStreamEvent
 
     from .agent import ExecutionSpec
     from .runner import Runner
@@ -38,11 +44,45 @@ current_chatkit_context: ContextVar[ChatKitExecutionContext | None] = ContextVar
 )
 
 
+class ChatKitAPI(NamedTuple):
+    """chatkit names used while a flow runs, resolved once by chatkit_api()."""
+
+    AssistantMessageContent: Any
+    AssistantMessageItem: Any
+    ThreadItemAddedEvent: Any
+    ThreadItemDoneEvent: Any
+    stream_agent_response: Any
+
+
+@lru_cache(maxsize=1)
+def chatkit_api() -> ChatKitAPI:
+    """Import chatkit on first use and cache the names the emit paths need.
+
+    chatkit is slow to import, so `import agentic_flow` does not pull it in;
+    after the first call, emit paths skip the per-call import statements.
+    """
+    from chatkit.agents import stream_agent_response
+    from chatkit.types import (
+        AssistantMessageContent,
+        AssistantMessageItem,
+        ThreadItemAddedEvent,
+        ThreadItemDoneEvent,
+    )
+
+    return ChatKitAPI(
+        AssistantMessageContent,
+        AssistantMessageItem,
+        ThreadItemAddedEvent,
+        ThreadItemDoneEvent,
+        stream_agent_response,
+    )
+
+
 class ChatKitExecutionContext:
     """Context for ChatKit Server execution with workflow boundary management.
 
     Manages:
-    - Event queue for streaming to frontend
+    - Event buffer for streaming to frontend (single consumer, woken by a Future)
     - Workflow boundaries for multi-agent flows
     - Agent execution with stream_agent_response
     """
@@ -50,7 +90,11 @@ class ChatKitExecutionContext:
     def __init__(self, agent_context: AgentContext, store: Store):
         self.agent_context = agent_context
         self.store = store
-        self.event_queue: asyncio.Queue[ThreadStreamEvent] = asyncio.Queue()
+        self.events: deque[ThreadStreamEvent] = deque()
+        self.waiter: asyncio.Future[None] | None = None
+        # Bound once; every emitted message calls both.
+        self.now = datetime.now
+        self.generate_item_id = store.generate_item_id
 
     @property
     def thread(self):
@@ -63,23 +107,7 @@ class ChatKitExecutionContext:
         stream_agent_response sees a message (not workflow) as last item
         and creates a new workflow for reasoning display.
         """
-        from chatkit.types import (
-            AssistantMessageContent,
-            AssistantMessageItem,
-            ThreadItemAddedEvent,
-            ThreadItemDoneEvent,
-        )
-
-        item_id = self.store.generate_item_id("message", self.thread, {})
-        item = AssistantMessageItem(
-            id=item_id,
-            thread_id=self.thread.id,
-            created_at=datetime.now(),
-            content=[AssistantMessageContent(type="output_text", text=label, annotations=[])],
-        )
-        await self.store.add_thread_item(self.thread.id, item, self.agent_context.request_context)
-        await self.push_event(ThreadItemAddedEvent(type="thread.item.added", item=item))
-        await self.push_event(ThreadItemDoneEvent(type="thread.item.done", item=item))
+        await self.emit_message(label)
 
     async def emit_agent_result(self, output: Any) -> None:
         """Emit agent result as message for UI display (non-streaming execution).
@@ -88,27 +116,30 @@ class ChatKitExecutionContext:
         ChatKit UI. Streaming calls use execute_spec() which handles display
         through stream_agent_response().
         """
-        from chatkit.types import (
-            AssistantMessageContent,
-            AssistantMessageItem,
-            ThreadItemAddedEvent,
-            ThreadItemDoneEvent,
+        await self.emit_message(serialize_output(output))
+
+    def new_message_item(self, text: str) -> AssistantMessageItem:
+        """Build an AssistantMessageItem for this thread (not yet stored)."""
+        ck = chatkit_api()
+        thread = self.thread
+        return ck.AssistantMessageItem(
+            id=self.generate_item_id("message", thread, {}),
+            thread_id=thread.id,
+            created_at=self.now(),
+            content=[ck.AssistantMessageContent(type="output_text", text=text, annotations=[])],
         )
 
-        from .utils import serialize_output
-
-        output_str = serialize_output(output)
-
-        item_id = self.store.generate_item_id("message", self.thread, {})
-        item = AssistantMessageItem(
-            id=item_id,
-            thread_id=self.thread.id,
-            created_at=datetime.now(),
-            content=[AssistantMessageContent(type="output_text", text=output_str, annotations=[])],
-        )
+    async def emit_message(self, text: str) -> None:
+        """Save an assistant message to store and stream its added/done events."""
+        ck = chatkit_api()
+        item = self.new_message_item(text)
         await self.store.add_thread_item(self.thread.id, item, self.agent_context.request_context)
-        await self.push_event(ThreadItemAddedEvent(type="thread.item.added", item=item))
-        await self.push_event(ThreadItemDoneEvent(type="thread.item.done", item=item))
+        await self.push_events(
+            (
+                ck.ThreadItemAddedEvent(type="thread.item.added", item=item),
+                ck.ThreadItemDoneEvent(type="thread.item.done", item=item),
+            )
+        )
 
     async def close_workflow(self) -> None:
         """Close the current workflow after agent execution (best effort).
@@ -137,7 +168,7 @@ class ChatKitExecutionContext:
     async def execute_spec(self, spec: ExecutionSpec) -> Any:
         """Execute ExecutionSpec with stream_agent_response.
 
-        Streams events to the queue and returns final output.
+        Streams events to the event buffer and returns final output.
         Returns T (str or Pydantic model based on Agent's output_type).
 
         Note: Uses Runner.run_streamed with context=agent_context to enable
@@ -151,25 +182,20 @@ class ChatKitExecutionContext:
         SDK constraint: list input + session is not allowed.
         resolve_input() returns (str, session) or (list, None) appropriately.
 
-        When is_silent=True, events are not pushed to the queue (no UI display).
+        When is_silent=True, events are not pushed (no UI display).
         """
-        from agents import Runner
-        from chatkit.agents import stream_agent_response
-
         input_data, session = spec.resolve_input()
 
         # Build run_kwargs: session + spec modifiers (.run_config, .run_kwarg, .max_turns)
-        run_kwargs: dict = {"session": session, **spec.run_kwargs}
-        if spec.max_turns_sdk is not None:
-            run_kwargs["max_turns"] = spec.max_turns_sdk
+        run_kwargs = spec.sdk_run_kwargs(session)
 
         # ChatKit context overwrites .context() modifier (required for workflow display)
         # Limitation: .context() is not supported in ChatKit mode
         run_kwargs["context"] = self.agent_context
 
-        result = Runner.run_streamed(spec.sdk_agent, input_data, **run_kwargs)
+        result = SDKRunner.run_streamed(spec.sdk_agent, input_data, **run_kwargs)
 
-        async for event in stream_agent_response(self.agent_context, result):
+        async for event in chatkit_api().stream_agent_response(self.agent_context, result):
             if not spec.is_silent:
                 await self.push_event(event)
 
@@ -179,8 +205,20 @@ class ChatKitExecutionContext:
         return result.final_output
 
     async def push_event(self, event: ThreadStreamEvent) -> None:
-        """Push event to queue."""
-        await self.event_queue.put(event)
+        """Buffer event and wake the consumer."""
+        self.events.append(event)
+        self.wake()
+
+    async def push_events(self, events: Iterable[ThreadStreamEvent]) -> None:
+        """Buffer several events and wake the consumer once."""
+        self.events.extend(events)
+        self.wake()
+
+    def wake(self) -> None:
+        """Resolve the consumer's waiter, if it is waiting."""
+        waiter = self.waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
 
 
 async def run_with_chatkit_context(
@@ -220,31 +258,20 @@ async def run_with_chatkit_context(
     flow_task: asyncio.Task[Any] = asyncio.create_task(
         cast(Coroutine[Any, Any, Any], runner.flow(user_message))
     )
-
-    async def get_next_event():
-        return await ctx.event_queue.get()
+    # Flow completion also wakes the consumer, so no per-event Task or asyncio.wait().
+    flow_task.add_done_callback(lambda _: ctx.wake())
+    loop = asyncio.get_running_loop()
+    events = ctx.events
 
     try:
-        while not flow_task.done():
-            event_task = asyncio.create_task(get_next_event())
-            done, pending = await asyncio.wait(
-                [flow_task, event_task],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            if event_task in done:
-                event = event_task.result()
-                yield event
-            else:
-                event_task.cancel()
-                try:
-                    await event_task
-                except asyncio.CancelledError:
-                    pass
-
-        while not ctx.event_queue.empty():
-            event = await ctx.event_queue.get()
-            yield event
+        while True:
+            while events:
+                yield events.popleft()
+            if flow_task.done():
+                break
+            ctx.waiter = loop.create_future()
+            await ctx.waiter
+            ctx.waiter = None
 
         await flow_task
 
@@ -258,30 +285,13 @@ async def run_with_chatkit_context(
         raise
 
     except Exception as e:
-        from chatkit.types import (
-            AssistantMessageContent,
-            AssistantMessageItem,
-            ThreadItemAddedEvent,
-            ThreadItemDoneEvent,
-        )
-
-        error_item = AssistantMessageItem(
-            id=ctx.store.generate_item_id("message", ctx.thread, {}),
-            thread_id=ctx.thread.id,
-            created_at=datetime.now(),
-            content=[
-                AssistantMessageContent(
-                    type="output_text",
-                    text=f"Error: {type(e).__name__}: {e}",
-                    annotations=[],
-                )
-            ],
-        )
+        ck = chatkit_api()
+        error_item = ctx.new_message_item(f"Error: {type(e).__name__}: {e}")
         await ctx.store.add_thread_item(
             ctx.thread.id, error_item, ctx.agent_context.request_context
         )
-        yield ThreadItemAddedEvent(type="thread.item.added", item=error_item)
-        yield ThreadItemDoneEvent(type="thread.item.done", item=error_item)
+        yield ck.ThreadItemAddedEvent(type="thread.item.added", item=error_item)
+        yield ck.ThreadItemDoneEvent(type="thread.item.done", item=error_item)
         raise
 
     finally:
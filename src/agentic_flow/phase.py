@@ -14,11 +14,11 @@ ChatKit Integration:
 
 from __future__ import annotations
 
+import inspect
 import logging
 import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
 from agents.items import TResponseInputItem
@@ -26,23 +26,17 @@ from agents.memory.session import SessionABC
 
 from .agent import (
     current_handler,
+    current_in_phase,
     current_phase_session,
+    current_phase_session_history,
     current_session,
+    is_async_handler,
 )
 from .chatkit import current_chatkit_context
 from .types import PhaseEnded, PhaseStarted
 
 if TYPE_CHECKING:
-    pass
-
-# Indicates whether execution is inside a phase (regardless of share_context)
-current_in_phase: ContextVar[bool] = ContextVar("current_in_phase", default=False)
-
-# Cached Session history for share_context=False phases
-# This is set at phase start and cleared at phase end
-current_phase_session_history: ContextVar[list | None] = ContextVar(
-    "current_phase_session_history", default=None
-)
+    from agents import Session
 
 
 class PhaseSession(SessionABC):
@@ -61,6 +55,10 @@ class PhaseSession(SessionABC):
         This allows Agents in phase to see past conversation while
         writing only to PhaseSession (not parent Session).
 
+    last_assistant_index tracks the newest assistant message in items as
+    they are added (indexed_length is len(items) at that point), so
+    phase(persist=True) does not rescan the phase.
+
     Example:
         async with phase("Research", share_context=True) as p:
             result1 = await agent1(query).stream()
@@ -68,12 +66,25 @@ class PhaseSession(SessionABC):
             p.summary = result2
     """
 
+    # Core fields live in slots; any other attribute is stored in data.
+    __slots__ = (
+        "session_id",
+        "label",
+        "items",
+        "data",
+        "inherited_history",
+        "last_assistant_index",
+        "indexed_length",
+    )
+
     def __init__(self, label: str, inherited_history: list[TResponseInputItem] | None = None):
         self.session_id = f"phase_{label}_{id(self)}"
         self.label = label
         self.items: list[TResponseInputItem] = []
         self.data: dict[str, Any] = {}
         self.inherited_history: list[TResponseInputItem] = inherited_history or []
+        self.last_assistant_index = -1
+        self.indexed_length = 0
 
     async def get_items(self, limit: int | None = None) -> list[TResponseInputItem]:
         """Return inherited + phase-local items.
@@ -81,60 +92,104 @@ class PhaseSession(SessionABC):
         This provides full conversation context to the LLM,
         including history inherited from parent Session.
         """
-        full = list(self.inherited_history) + list(self.items)
-        if limit is not None:
-            return full[-limit:]
-        return full
+        if limit is None:
+            return self.inherited_history + self.items
+        if limit > 0:
+            # Slice each layer instead of building the full list first.
+            items = self.items
+            if limit <= len(items):
+                return items[-limit:]
+            return self.inherited_history[len(items) - limit :] + items
+        return (self.inherited_history + self.items)[-limit:]
 
     async def add_items(self, new_items: list[TResponseInputItem]) -> None:
         """Add items to phase-local storage.
 
         Called by SDK. Does NOT modify inherited_history.
         """
+        start = len(self.items)
         self.items.extend(new_items)
+        for i in range(len(new_items) - 1, -1, -1):
+            if is_assistant_message(new_items[i]):
+                self.last_assistant_index = start + i
+                break
+        self.indexed_length = len(self.items)
 
     async def pop_item(self) -> TResponseInputItem | None:
         """Pop from phase-local items only."""
         if self.items:
-            return self.items.pop()
+            item = self.items.pop()
+            if self.last_assistant_index >= len(self.items):
+                self.last_assistant_index = self.find_last_assistant()
+            self.indexed_length = len(self.items)
+            return item
         return None
 
     async def clear_session(self) -> None:
         """Clear phase-local items only."""
         self.items.clear()
+        self.last_assistant_index = -1
+        self.indexed_length = 0
+
+    def find_last_assistant(self) -> int:
+        """Index of the newest assistant message in items, or -1 (full scan)."""
+        items = self.items
+        for i in range(len(items) - 1, -1, -1):
+            if is_assistant_message(items[i]):
+                return i
+        return -1
+
+    def last_assistant_turn(self) -> list[TResponseInputItem]:
+        """Newest assistant message, preceded by its reasoning item if any.
+
+        Reasoning models return [reasoning, message] pairs that must stay
+        together when written to a Session. Returns [] if there is none.
+        """
+        items = self.items
+        i = self.last_assistant_index
+        if len(items) != self.indexed_length or (i >= 0 and not is_assistant_message(items[i])):
+            # items was changed without add_items(); fall back to a scan.
+            i = self.find_last_assistant()
+        if i < 0:
+            return []
+        if i > 0 and items[i - 1].get("type") == "reasoning":
+            return [items[i - 1], items[i]]
+        return [items[i]]
 
     def __getattr__(self, name: str) -> Any:
-        """Dynamic attribute access via data dict."""
-        try:
-            data = object.__getattribute__(self, "data")
-            if name in data:
-                return data[name]
-        except AttributeError:
-            pass
+        """Dynamic attribute access via data dict (only reached for non-core names)."""
+        if name != "data":
+            try:
+                return self.data[name]
+            except KeyError:
+                pass
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Dynamic attribute setting via data dict."""
-        if name in ("session_id", "label", "items", "data", "inherited_history"):
+        if name in PHASE_SESSION_FIELDS:
             object.__setattr__(self, name, value)
         else:
-            try:
-                data = object.__getattribute__(self, "data")
-                data[name] = value
-            except AttributeError:
-                object.__setattr__(self, name, value)
+            self.data[name] = value
+
+
+PHASE_SESSION_FIELDS = frozenset(PhaseSession.__slots__)
 
 
 logger = logging.getLogger(__name__)
 
 
-async def get_session_history() -> list[TResponseInputItem]:
-    """Get history from current Session if available.
+def is_assistant_message(item: TResponseInputItem) -> bool:
+    """Whether item is an assistant message with content."""
+    return item.get("role") == "assistant" and bool(item.get("content"))
+
+
+async def get_session_history(session: Session | None) -> list[TResponseInputItem]:
+    """Get history from the given Session (the caller's current_session).
 
     Returns empty list if no Session is set.
     Session.get_items() is async, returns list of message dicts.
     """
-    session = current_session.get()
     if session is None:
         return []
     try:
@@ -174,16 +229,22 @@ async def phase(
     """
     start = time.perf_counter()
 
+    # Read each ambient ContextVar once; enter and exit both use these locals.
+    session = current_session.get()
+    handler = current_handler.get()
+    chatkit_ctx = current_chatkit_context.get()
+
     phase_session: PhaseSession | None = None
     session_history_token = None
 
     if share_context:
-        inherited_history = await get_session_history()
+        inherited_history = await get_session_history(session)
         phase_session = PhaseSession(label, inherited_history=inherited_history)
     else:
         # share_context=False: snapshot Session history at phase start (read-only).
         # This snapshot is fixed for predictability; concurrent writes are not reflected.
-        cached_history = await get_session_history()
+        # Stored as a tuple so every spec in the phase shares it without copying defensively.
+        cached_history = tuple(await get_session_history(session))
         session_history_token = current_phase_session_history.set(cached_history)
 
     phase_session_token = None
@@ -195,14 +256,18 @@ async def phase(
 
     # Emit PhaseStarted to handler
     phase_started_event = PhaseStarted(label=label)
-    handler = current_handler.get()
+    # Decided once for both PhaseStarted and PhaseEnded; sync handlers may still
+    # return an awaitable, which is awaited as before.
+    handler_is_async = handler is not None and is_async_handler(handler)
     if handler is not None:
-        result = handler(phase_started_event)
-        if hasattr(result, "__await__"):
-            await result
+        if handler_is_async:
+            await handler(phase_started_event)
+        else:
+            result = handler(phase_started_event)
+            if result is not None and inspect.isawaitable(result):
+                await result
 
     # ChatKit integration: emit phase label to create workflow boundary
-    chatkit_ctx = current_chatkit_context.get()
     if chatkit_ctx is not None:
         await chatkit_ctx.emit_phase_label(label)
 
@@ -216,22 +281,12 @@ async def phase(
         # User message management is the programmer's responsibility.
         # Note: reasoning models return [reasoning, message] pairs that must stay together.
         if persist and phase_session is not None and phase_session.items:
-            session = current_session.get()
-            if session is not None:
-                items = phase_session.items
-                for i in range(len(items) - 1, -1, -1):
-                    item = items[i]
-                    if item.get("role") == "assistant" and item.get("content"):
-                        # Check if preceding item is a reasoning item (required by API)
-                        to_persist = []
-                        if i > 0 and items[i - 1].get("type") == "reasoning":
-                            to_persist.append(items[i - 1])
-                        to_persist.append(item)
-                        try:
-                            await session.add_items(to_persist)
-                        except Exception as e:
-                            logger.warning("Failed to persist phase result to session: %s", e)
-                        break
+            to_persist = phase_session.last_assistant_turn()
+            if session is not None and to_persist:
+                try:
+                    await session.add_items(to_persist)
+                except Exception as e:
+                    logger.warning("Failed to persist phase result to session: %s", e)
 
         # ChatKit integration: close workflow to allow next phase to create new one
         if chatkit_ctx is not None:
@@ -240,9 +295,12 @@ async def phase(
         # Emit PhaseEnded to handler
         phase_ended_event = PhaseEnded(label=label, elapsed_ms=elapsed_ms)
         if handler is not None:
-            result = handler(phase_ended_event)
-            if hasattr(result, "__await__"):
-                await result
+            if handler_is_async:
+                await handler(phase_ended_event)
+            else:
+                result = handler(phase_ended_event)
+                if result is not None and inspect.isawaitable(result):
+                    await result
 
         # Reset in_phase flag
         current_in_phase.reset(in_phase_token)
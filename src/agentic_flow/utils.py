@@ -6,6 +6,7 @@ They return standard SDK types that can be passed to Agent.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any, Literal
 
 from agents import ModelSettings
@@ -19,6 +20,8 @@ def serialize_output(output: Any) -> str:
     """Serialize agent output to string.
 
     Handles str, Pydantic models, and other types consistently.
+    Dispatches on type(output) through SERIALIZERS; the isinstance checks
+    run only the first time a type is seen.
 
     Args:
         output: Agent output (str, BaseModel, or other)
@@ -26,12 +29,32 @@ def serialize_output(output: Any) -> str:
     Returns:
         String representation of the output
     """
-    if isinstance(output, str):
-        return output
-    elif isinstance(output, BaseModel):
-        return output.model_dump_json()
+    serializer = SERIALIZERS.get(type(output))
+    if serializer is None:
+        serializer = serializer_for(type(output))
+    return serializer(output)
+
+
+def return_as_is(output: str) -> str:
+    """Serializer for str outputs: already a string."""
+    return output
+
+
+# type(output) -> serializer, filled in by serializer_for() as new types appear.
+SERIALIZERS: dict[type, Callable[[Any], str]] = {str: return_as_is}
+
+
+def serializer_for(cls: type) -> Callable[[Any], str]:
+    """Choose the serializer for cls and cache it in SERIALIZERS."""
+    serializer: Callable[[Any], str]
+    if issubclass(cls, str):
+        serializer = return_as_is
+    elif issubclass(cls, BaseModel):
+        serializer = cls.model_dump_json
     else:
-        return str(output)
+        serializer = str
+    SERIALIZERS[cls] = serializer
+    return serializer
 
 
 def reasoning(
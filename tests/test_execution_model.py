@@ -239,3 +239,13 @@ class TestBeautifulForms:
         chat2 = Runner(flow=flow_iso_stream, handler=handler_log)
         r4 = await chat2("Should we continue?")
         assert isinstance(r4, Decision)
+
+    @pytest.mark.asyncio
+    async def test_batch_form(self):
+        """outs = await agent.run_batch_async(prompts, isolated=True)"""
+        agent = Agent(name="batch", instructions="Reply OK", model="gpt-5.2")
+
+        outs = await agent.run_batch_async(["a", "b", "c"], concurrency=2, isolated=True)
+
+        assert len(outs) == 3
+        assert all(isinstance(out, str) and "OK" in out for out in outs)
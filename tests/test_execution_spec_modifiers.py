@@ -13,11 +13,14 @@ No mocks required - pure unit tests.
 
 from __future__ import annotations
 
+import asyncio
+import weakref
 from dataclasses import dataclass
 
+import pytest
 from pydantic import BaseModel
 
-from agentic_flow import Agent, ExecutionSpec
+from agentic_flow import Agent, ExecutionSpec, gather_specs
 
 
 class Analysis(BaseModel):
@@ -72,6 +75,58 @@ class TestExecutionSpecTypeParameter:
             isinstance(s, ExecutionSpec) for s in [spec1, spec2, spec3, spec4, spec5]
         )
 
+    def test_specs_hash_by_identity(self):
+        """Equal-looking specs are distinct; each is hashable by identity."""
+        assistant = Agent(name="assistant", instructions="...", model="gpt-5.2")
+        spec1 = assistant("Hello")
+        spec2 = assistant("Hello")
+
+        assert spec1 != spec2
+        assert len({spec1, spec1, spec2}) == 2
+
+    def test_specs_support_weakrefs(self):
+        """Specs can be weakly referenced."""
+        assistant = Agent(name="assistant", instructions="...", model="gpt-5.2")
+        spec = assistant("Hello")
+
+        assert weakref.ref(spec)() is spec
+
+    def test_modifiers_on_subclass_keep_fields(self):
+        """Modifiers on a subclass instance copy every ExecutionSpec field."""
+        assistant = Agent(name="assistant", instructions="...", model="gpt-5.2")
+        spec = ScriptedSpec(sdk_agent=assistant.sdk_agent, input="Hello").max_turns(2)
+
+        modified = spec.isolated().stream()
+
+        assert type(modified) is ScriptedSpec
+        assert modified.input == "Hello"
+        assert modified.max_turns_sdk == 2
+        assert modified.is_isolated and modified.streaming
+
+    def test_modifiers_keep_fields_declared_by_subclass(self):
+        """Fields a dataclass subclass adds survive modifiers too."""
+
+        @dataclass(eq=False, slots=True)
+        class TaggedSpec(ExecutionSpec):
+            tag: str = "x"
+
+        assistant = Agent(name="assistant", instructions="...", model="gpt-5.2")
+        spec = TaggedSpec(sdk_agent=assistant.sdk_agent, input="Hello", tag="keep")
+
+        modified = spec.stream().max_turns(2)
+
+        assert type(modified) is TaggedSpec
+        assert modified.tag == "keep"
+        assert modified.streaming and modified.max_turns_sdk == 2
+        assert modified.copy_with(tag="new").tag == "new"
+
+    def test_copy_with_rejects_unknown_fields(self):
+        """A misspelled field name raises instead of being ignored."""
+        assistant = Agent(name="assistant", instructions="...", model="gpt-5.2")
+
+        with pytest.raises(TypeError, match="stream"):
+            assistant("Hello").copy_with(stream=True)
+
 
 # =============================================================================
 # WHERE Axis: .isolated()
@@ -433,6 +488,23 @@ class TestModifierCombinations:
         assert "context" in spec.run_kwargs
         assert spec.run_kwargs.get("extra") == "value"
 
+    def test_sdk_run_kwargs_plain_spec(self):
+        """A spec without modifiers passes only the session to the SDK."""
+        agent = Agent(name="test", instructions="test")
+        session = object()
+
+        assert agent("prompt").sdk_run_kwargs(session) == {"session": session}
+
+    def test_sdk_run_kwargs_merges_modifiers(self):
+        """Session, SDK pass-through kwargs and max_turns are merged for the SDK."""
+        agent = Agent(name="test", instructions="test")
+        spec = agent("prompt").run_kwarg(extra="value").max_turns(3)
+
+        run_kwargs = spec.sdk_run_kwargs(None)
+
+        assert run_kwargs == {"session": None, "extra": "value", "max_turns": 3}
+        assert "session" not in spec.run_kwargs
+
 
 # =============================================================================
 # Call-Spec Discipline: Forbidden Forms
@@ -678,3 +750,119 @@ class TestContextWithStream:
 
         assert spec.run_kwargs.get("context") is ctx
         assert spec.streaming is True
+
+
+class TestBatch:
+    """Tests for Agent.batch() and run_batch_async() - no API calls."""
+
+    def test_batch_returns_one_spec_per_input(self):
+        """batch() creates unexecuted specs in input order."""
+        agent = Agent(name="test", instructions="test")
+
+        specs = agent.batch(["a", "b", "c"])
+
+        assert [spec.input for spec in specs] == ["a", "b", "c"]
+        assert all(isinstance(spec, ExecutionSpec) for spec in specs)
+        assert all(spec.sdk_agent is agent.sdk_agent for spec in specs)
+
+    def test_batch_specs_accept_modifiers(self):
+        """Specs from batch() chain modifiers like any other spec."""
+        agent = Agent(name="test", instructions="test")
+
+        specs = [spec.isolated().max_turns(3) for spec in agent.batch(["a", "b"])]
+
+        assert all(spec.is_isolated for spec in specs)
+        assert all(spec.max_turns_sdk == 3 for spec in specs)
+
+    @pytest.mark.asyncio
+    async def test_run_batch_async_empty(self):
+        """No inputs means no calls and an empty result."""
+        agent = Agent(name="test", instructions="test")
+
+        assert await agent.run_batch_async([]) == []
+        assert await ExecutionSpec.run_batch_async([]) == []
+
+    @pytest.mark.asyncio
+    async def test_run_batch_async_rejects_zero_concurrency(self):
+        """concurrency must allow at least one call in flight."""
+        with pytest.raises(ValueError):
+            await ExecutionSpec.run_batch_async([], concurrency=0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    async def test_run_batch_async_returns_exceptions_in_place(self, concurrency):
+        """Sequential and concurrent paths both return a failure in its slot."""
+        agent = Agent(name="test", instructions="test")
+        specs = [ScriptedSpec(sdk_agent=agent.sdk_agent, input=x) for x in ("fail", "fast")]
+
+        results = await ExecutionSpec.run_batch_async(specs, concurrency=concurrency)
+
+        assert isinstance(results[0], ValueError)
+        assert results[1] == "FAST"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    async def test_run_batch_async_propagates_cancellation(self, concurrency):
+        """CancelledError is not captured as a result on either path."""
+
+        class CancellingSpec(ScriptedSpec):
+            __slots__ = ()
+
+            async def execute(self):
+                if self.input == "cancel":
+                    raise asyncio.CancelledError
+                return await super().execute()
+
+        agent = Agent(name="test", instructions="test")
+        specs = [CancellingSpec(sdk_agent=agent.sdk_agent, input=x) for x in ("cancel", "fast")]
+
+        with pytest.raises(asyncio.CancelledError):
+            await ExecutionSpec.run_batch_async(specs, concurrency=concurrency)
+
+
+class ScriptedSpec(ExecutionSpec):
+    """ExecutionSpec whose execute() follows its input instead of calling the SDK."""
+
+    __slots__ = ()
+
+    cancelled: list[str] = []
+
+    async def execute(self):
+        if self.input == "fail":
+            raise ValueError("boom")
+        try:
+            await asyncio.sleep(0.01 if self.input == "slow" else 0)
+        except asyncio.CancelledError:
+            ScriptedSpec.cancelled.append(self.input)
+            raise
+        return self.input.upper()
+
+
+class TestGatherSpecs:
+    """Tests for gather_specs() - no API calls."""
+
+    @pytest.mark.asyncio
+    async def test_gather_specs_empty(self):
+        """No specs means an empty result."""
+        assert await gather_specs() == []
+
+    @pytest.mark.asyncio
+    async def test_gather_specs_preserves_argument_order(self):
+        """Results follow argument order, not completion order."""
+        agent = Agent(name="test", instructions="test")
+        specs = [ScriptedSpec(sdk_agent=agent.sdk_agent, input=x) for x in ("slow", "fast")]
+
+        assert await gather_specs(*specs) == ["SLOW", "FAST"]
+
+    @pytest.mark.asyncio
+    async def test_gather_specs_cancels_siblings_on_failure(self):
+        """A failing spec cancels in-flight siblings instead of letting them finish."""
+        agent = Agent(name="test", instructions="test")
+        specs = [ScriptedSpec(sdk_agent=agent.sdk_agent, input=x) for x in ("slow", "fail")]
+        ScriptedSpec.cancelled.clear()
+
+        with pytest.raises(ExceptionGroup) as excinfo:
+            await gather_specs(*specs)
+
+        assert [type(e) for e in excinfo.value.exceptions] == [ValueError]
+        assert ScriptedSpec.cancelled == ["slow"]
@@ -233,3 +233,36 @@ class TestToolsAndHandoffsCombined:
 
         print(f"Coordinator result: {result}")
         assert len(result) > 0
+
+
+class TestSDKAgentIsolation:
+    """Each Agent owns its SDK Agent, even when declared identically."""
+
+    def test_identical_kwargs_get_own_sdk_agent(self):
+        """Same kwargs (including the same tool objects) still build separate SDK Agents."""
+        a = Agent(name="shared", instructions="Same.", model="gpt-5.2", tools=[search_database])
+        b = Agent(name="shared", instructions="Same.", model="gpt-5.2", tools=[search_database])
+
+        assert a.sdk_agent is not b.sdk_agent
+
+    def test_mutating_one_sdk_agent_leaves_twin_untouched(self):
+        """Changing one SDK Agent (e.g. handoffs) does not leak into an identical Agent."""
+        a = Agent(name="shared", instructions="Same.", model="gpt-5.2")
+        b = Agent(name="shared", instructions="Same.", model="gpt-5.2")
+
+        a.sdk_agent.instructions = "Changed."
+        a.sdk_agent.handoffs.append(b.sdk_agent)
+
+        assert b.sdk_agent.instructions == "Same."
+        assert b.sdk_agent.handoffs == []
+
+    def test_output_type_is_passed_through(self):
+        """output_type reaches the SDK Agent."""
+        from pydantic import BaseModel
+
+        class Verdict(BaseModel):
+            ok: bool
+
+        typed = Agent(name="typed", instructions="Judge.", model="gpt-5.2", output_type=Verdict)
+
+        assert typed.sdk_agent.output_type is Verdict
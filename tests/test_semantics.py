@@ -20,6 +20,8 @@ Design Philosophy Reference (docs/design/):
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -474,6 +476,70 @@ class TestChatKitBoundary:
         finally:
             current_chatkit_context.reset(token)
 
+    @pytest.mark.asyncio
+    async def test_run_with_chatkit_context_yields_events_in_order(self):
+        """Events pushed by the flow are yielded in order, including ones pushed last."""
+        from chatkit.types import ThreadMetadata
+
+        from agentic_flow.chatkit import current_chatkit_context, run_with_chatkit_context
+
+        async def flow(message: str) -> str:
+            ctx = current_chatkit_context.get()
+            await ctx.push_event("first")
+            await ctx.push_event("second")
+            await asyncio.sleep(0.01)
+            await ctx.push_event("last")
+            return message
+
+        thread = ThreadMetadata(id="thread_1", created_at=datetime.now())
+        events = [
+            event
+            async for event in run_with_chatkit_context(
+                Runner(flow=flow), thread, MagicMock(), {}, "hello"
+            )
+        ]
+
+        assert events == ["first", "second", "last"]
+        assert current_chatkit_context.get() is None
+
+    @pytest.mark.asyncio
+    async def test_emit_phase_label_stores_item_and_pushes_both_events(self):
+        """emit_phase_label() saves one message and buffers its added/done events."""
+        from chatkit.types import ThreadMetadata
+
+        from agentic_flow.chatkit import ChatKitExecutionContext
+
+        agent_context = MagicMock()
+        agent_context.thread = ThreadMetadata(id="thread_1", created_at=datetime.now())
+        store = MagicMock()
+        store.generate_item_id.return_value = "msg_1"
+        store.add_thread_item = AsyncMock()
+
+        ctx = ChatKitExecutionContext(agent_context, store)
+        await ctx.emit_phase_label("Research")
+
+        store.add_thread_item.assert_awaited_once()
+        assert [event.type for event in ctx.events] == ["thread.item.added", "thread.item.done"]
+        assert ctx.events[0].item.content[0].text == "Research"
+
+
+class TestSerializeOutput:
+    """serialize_output() turns agent results into ChatKit message text."""
+
+    def test_serializes_str_model_and_other(self):
+        """str is returned as-is, models as JSON, anything else via str()."""
+        from pydantic import BaseModel
+
+        from agentic_flow.utils import serialize_output
+
+        class Verdict(BaseModel):
+            approved: bool
+
+        assert serialize_output("hello") == "hello"
+        assert serialize_output(Verdict(approved=True)) == '{"approved":true}'
+        assert serialize_output(Verdict(approved=False)) == '{"approved":false}'
+        assert serialize_output(42) == "42"
+
 
 class TestEventTypeSystem:
     """Test that Event and Handler types are correctly defined.
@@ -610,6 +676,67 @@ class TestPhaseEventsToHandler:
         assert len(phase_started) == 1
         assert phase_started[0].label == "TestPhase"
 
+    @pytest.mark.asyncio
+    async def test_sync_handler_returning_awaitable_is_awaited(self, monkeypatch):
+        """A sync handler that returns a coroutine still has it awaited."""
+        from agentic_flow import agent as agent_module
+        from agentic_flow.types import AgentResult
+
+        monkeypatch.setattr(
+            agent_module.Runner, "run", AsyncMock(return_value=MagicMock(final_output="ok"))
+        )
+        events = []
+
+        async def on_event(event):
+            events.append(event)
+
+        async def flow(msg: str) -> str:
+            return await Agent(name="test", instructions="test")(msg)
+
+        chat = Runner(flow=flow, handler=lambda event: on_event(event))
+        assert await chat("test") == "ok"
+
+        assert [type(e) for e in events] == [AgentResult]
+
+    @pytest.mark.asyncio
+    async def test_async_handler_receives_phase_events(self):
+        """An async handler is awaited for both PhaseStarted and PhaseEnded."""
+        from agentic_flow.types import PhaseEnded, PhaseStarted
+
+        events = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            events.append(event)
+
+        async def flow(msg: str) -> str:
+            async with phase("TestPhase"):
+                return "done"
+
+        chat = Runner(flow=flow, handler=handler)
+        await chat("test")
+
+        assert [type(e) for e in events] == [PhaseStarted, PhaseEnded]
+
+    @pytest.mark.asyncio
+    async def test_sync_handler_returning_awaitable_receives_phase_events(self):
+        """A sync handler that returns a coroutine has it awaited for both phase events."""
+        from agentic_flow.types import PhaseEnded, PhaseStarted
+
+        events = []
+
+        async def record(event):
+            events.append(event)
+
+        async def flow(msg: str) -> str:
+            async with phase("TestPhase"):
+                return "done"
+
+        chat = Runner(flow=flow, handler=lambda event: record(event))
+        await chat("test")
+
+        assert [type(e) for e in events] == [PhaseStarted, PhaseEnded]
+
     @pytest.mark.asyncio
     async def test_handler_receives_phase_ended(self):
         """Handler should receive PhaseEnded event."""
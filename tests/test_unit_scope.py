@@ -14,6 +14,7 @@ from agentic_flow.agent import (
     current_handler,
     current_phase_session,
     current_session,
+    is_async_handler,
 )
 from agentic_flow.phase import PhaseSession
 
@@ -146,6 +147,33 @@ class TestRunnerHandlerInjection:
         assert current_phase_session.get() is None
 
 
+class TestAsyncHandlerDetection:
+    """Handler sync/async is decided once per stream, from the callable itself."""
+
+    def test_async_function_is_async(self):
+        async def handler(event):
+            pass
+
+        assert is_async_handler(handler)
+
+    def test_sync_function_is_not_async(self):
+        def handler(event):
+            pass
+
+        assert not is_async_handler(handler)
+
+    def test_async_callable_object_is_async(self):
+        class Display:
+            async def __call__(self, event):
+                pass
+
+            async def handle(self, event):
+                pass
+
+        assert is_async_handler(Display())
+        assert is_async_handler(Display().handle)
+
+
 class TestMessageFormat:
     """P0-2: PhaseSession message format must be SDK-compatible."""
 
@@ -245,6 +273,23 @@ class TestPhaseSessionInheritance:
         assert full[2]["content"] == "in phase"
         assert full[3]["content"] == "phase response"
 
+    @pytest.mark.asyncio
+    async def test_get_items_limit_spans_both_layers(self):
+        """get_items(limit) returns the newest items across inherited + phase-local."""
+        inherited = [{"role": "user", "content": f"h{i}"} for i in range(3)]
+        ctx = PhaseSession("test", inherited_history=inherited)
+        await ctx.add_items([{"role": "user", "content": f"p{i}"} for i in range(2)])
+
+        contents = [[item["content"] for item in await ctx.get_items(n)] for n in (1, 2, 4, 10)]
+
+        assert contents == [
+            ["p1"],
+            ["p0", "p1"],
+            ["h1", "h2", "p0", "p1"],
+            ["h0", "h1", "h2", "p0", "p1"],
+        ]
+        assert await ctx.get_items() is not ctx.items
+
     @pytest.mark.asyncio
     async def test_get_items_does_not_mutate_inherited(self):
         """get_items() should not mutate inherited_history."""
@@ -309,6 +354,88 @@ class TestPhaseSessionInheritance:
             current_session.reset(token)
 
 
+class TestPhaseSessionLastAssistant:
+    """PhaseSession tracks the newest assistant message for phase(persist=True)."""
+
+    @pytest.mark.asyncio
+    async def test_tracks_latest_assistant_with_reasoning(self):
+        """The newest assistant message is returned with its reasoning item."""
+        ctx = PhaseSession("test")
+        await ctx.add_items(
+            [
+                {"role": "user", "content": "q1"},
+                {"role": "assistant", "content": "a1"},
+            ]
+        )
+        await ctx.add_items(
+            [
+                {"type": "reasoning", "summary": []},
+                {"role": "assistant", "content": "a2"},
+                {"type": "function_call_output", "output": "ok"},
+            ]
+        )
+
+        assert ctx.last_assistant_index == 3
+        assert [item.get("content") for item in ctx.last_assistant_turn()] == [None, "a2"]
+
+    @pytest.mark.asyncio
+    async def test_pop_and_clear_update_tracking(self):
+        """pop_item() and clear_session() keep the tracked index valid."""
+        ctx = PhaseSession("test")
+        await ctx.add_items(
+            [
+                {"role": "assistant", "content": "a1"},
+                {"role": "user", "content": "q2"},
+                {"role": "assistant", "content": "a2"},
+            ]
+        )
+
+        await ctx.pop_item()
+        assert ctx.last_assistant_turn() == [{"role": "assistant", "content": "a1"}]
+
+        await ctx.clear_session()
+        assert ctx.last_assistant_index == -1
+        assert ctx.last_assistant_turn() == []
+
+    @pytest.mark.asyncio
+    async def test_direct_items_assignment_falls_back_to_scan(self):
+        """Replacing items directly still yields the right assistant message."""
+        ctx = PhaseSession("test")
+        await ctx.add_items([{"role": "assistant", "content": "old"}])
+
+        ctx.items = [{"role": "user", "content": "q"}, {"role": "assistant", "content": "new"}]
+
+        assert ctx.last_assistant_turn() == [{"role": "assistant", "content": "new"}]
+
+        ctx.items.append({"role": "assistant", "content": "appended"})
+
+        assert ctx.last_assistant_turn() == [{"role": "assistant", "content": "appended"}]
+
+    @pytest.mark.asyncio
+    async def test_persist_writes_last_turn_to_session(self):
+        """phase(persist=True) writes only the last reasoning + assistant pair."""
+        session = SQLiteSession(session_id="test_persist_turn", db_path=":memory:")
+        token = current_session.set(session)
+        try:
+            async with phase("Persist", persist=True) as ctx:
+                await ctx.add_items(
+                    [
+                        {"role": "user", "content": "q"},
+                        {"role": "assistant", "content": "draft"},
+                        {"type": "reasoning", "id": "rs_1", "summary": []},
+                        {"role": "assistant", "content": "final"},
+                    ]
+                )
+        finally:
+            current_session.reset(token)
+
+        persisted = await session.get_items()
+        assert [item.get("type") or item.get("content") for item in persisted] == [
+            "reasoning",
+            "final",
+        ]
+
+
 class TestPhaseSessionAttributeError:
     """PhaseSession should raise AttributeError for undefined attributes."""
 